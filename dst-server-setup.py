@@ -1,54 +1,23 @@
+import io
 import os
 import shutil
 import subprocess
 import sys
 import requests
 import json
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 import tkinter as tk
 from tkinter import messagebox, filedialog
 
-class DSTServerSetup:
-    def __init__(self):
-        self.steamcmd_path = "C:\\steamcmd"
-        self.documents_path = os.path.expanduser("~\\Documents")
-        self.klei_path = os.path.join(self.documents_path, "Klei")
-        self.dst_path = os.path.join(self.klei_path, "DoNotStarveTogether")
-        self.server_name = "MyDediServer"
-        
-    def create_directories(self):
-        """Create necessary directories for the server"""
-        directories = [
-            self.steamcmd_path,
-            self.klei_path,
-            self.dst_path,
-            os.path.join(self.dst_path, self.server_name),
-            os.path.join(self.dst_path, self.server_name, "Master"),
-            os.path.join(self.dst_path, self.server_name, "Caves")
-        ]
-        
-        for directory in directories:
-            os.makedirs(directory, exist_ok=True)
-            print(f"Created directory: {directory}")
-            
-    def download_steamcmd(self):
-        """Download and extract SteamCMD"""
-        steamcmd_url = "https://steamcdn-a.akamaihd.net/client/installer/steamcmd.zip"
-        zip_path = os.path.join(self.steamcmd_path, "steamcmd.zip")
-        
-        print("Downloading SteamCMD...")
-        response = requests.get(steamcmd_url)
-        with open(zip_path, 'wb') as f:
-            f.write(response.content)
-            
-        shutil.unpack_archive(zip_path, self.steamcmd_path)
-        os.remove(zip_path)
-        print("SteamCMD downloaded and extracted")
-        
-    def create_server_config(self):
-        """Create server configuration files"""
-        # cluster.ini
-        cluster_config = """[GAMEPLAY]
+# Shared HTTP session so repeated downloads reuse pooled connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=3))
+
+# Static INI payloads, stored as bytes so they can be written without re-encoding
+_CLUSTER_INI = b"""[GAMEPLAY]
 game_mode = survival
 max_players = 6
 pvp = false
@@ -70,9 +39,8 @@ master_ip = 127.0.0.1
 master_port = 10889
 cluster_key = defaultkey
 """
-        
-        # server.ini for Master
-        master_config = """[NETWORK]
+
+_MASTER_SERVER_INI = b"""[NETWORK]
 server_port = 10999
 
 [SHARD]
@@ -84,9 +52,8 @@ id = 1
 master_server_port = 27018
 authentication_port = 8768
 """
-        
-        # server.ini for Caves
-        caves_config = """[NETWORK]
+
+_CAVES_SERVER_INI = b"""[NETWORK]
 server_port = 10998
 
 [SHARD]
@@ -98,32 +65,81 @@ id = 2
 master_server_port = 27019
 authentication_port = 8769
 """
+
+# Startup batch file, pre-encoded with the CRLF line endings cmd.exe expects
+_START_BATCH = """@echo off
+cd /D "C:\\steamcmd"
+steamcmd.exe +login anonymous +app_update 343050 validate +quit
+cd /D "C:\\steamcmd\\steamapps\\common\\Don't Starve Together Dedicated Server\\bin64"
+start dontstarve_dedicated_server_nullrenderer_x64 -console -cluster MyDediServer -shard Master
+start dontstarve_dedicated_server_nullrenderer_x64 -console -cluster MyDediServer -shard Caves
+""".replace("\n", "\r\n").encode("ascii")
+
+class DSTServerSetup:
+    def __init__(self):
+        self.steamcmd_path = "C:\\steamcmd"
+        self.documents_path = os.path.expanduser("~\\Documents")
+        self.klei_path = os.path.join(self.documents_path, "Klei")
+        self.dst_path = os.path.join(self.klei_path, "DoNotStarveTogether")
+        self.server_name = "MyDediServer"
         
+    @staticmethod
+    def _write_file(path, data):
+        """Write bytes to path with a single unbuffered write"""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(path, flags, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+            
+    def create_directories(self):
+        """Create necessary directories for the server"""
+        # makedirs creates the Klei/DoNotStarveTogether/<server> ancestors itself
+        server_path = os.path.join(self.dst_path, self.server_name)
+        directories = [
+            self.steamcmd_path,
+            os.path.join(server_path, "Master"),
+            os.path.join(server_path, "Caves")
+        ]
+        
+        for directory in directories:
+            os.makedirs(directory, exist_ok=True)
+        print(f"Created directories under: {self.steamcmd_path}, {server_path}")
+            
+    def download_steamcmd(self):
+        """Download and extract SteamCMD"""
+        steamcmd_url = "https://steamcdn-a.akamaihd.net/client/installer/steamcmd.zip"
+        
+        print("Downloading SteamCMD...")
+        # The archive is only a few MB, so keep it in memory instead of a temp file
+        archive = io.BytesIO()
+        with _SESSION.get(steamcmd_url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            shutil.copyfileobj(response.raw, archive, length=1024 * 1024)
+            
+        with zipfile.ZipFile(archive) as z:
+            z.extractall(self.steamcmd_path)
+        print("SteamCMD downloaded and extracted")
+        
+    def create_server_config(self):
+        """Create server configuration files"""
         # Create the configuration files
-        configs = {
-            os.path.join(self.dst_path, self.server_name, "cluster.ini"): cluster_config,
-            os.path.join(self.dst_path, self.server_name, "Master", "server.ini"): master_config,
-            os.path.join(self.dst_path, self.server_name, "Caves", "server.ini"): caves_config
-        }
+        server_path = os.path.join(self.dst_path, self.server_name)
+        configs = (
+            (os.path.join(server_path, "cluster.ini"), _CLUSTER_INI),
+            (os.path.join(server_path, "Master", "server.ini"), _MASTER_SERVER_INI),
+            (os.path.join(server_path, "Caves", "server.ini"), _CAVES_SERVER_INI),
+        )
         
-        for path, content in configs.items():
-            with open(path, 'w') as f:
-                f.write(content)
+        for path, data in configs:
+            self._write_file(path, data)
             print(f"Created config file: {path}")
             
     def create_startup_script(self):
         """Create batch file to start the server"""
-        batch_content = """@echo off
-cd /D "C:\\steamcmd"
-steamcmd.exe +login anonymous +app_update 343050 validate +quit
-cd /D "C:\\steamcmd\\steamapps\\common\\Don't Starve Together Dedicated Server\\bin64"
-start dontstarve_dedicated_server_nullrenderer_x64 -console -cluster MyDediServer -shard Master
-start dontstarve_dedicated_server_nullrenderer_x64 -console -cluster MyDediServer -shard Caves
-"""
-        
         batch_path = os.path.join(self.klei_path, "StartDSTServers.bat")
-        with open(batch_path, 'w') as f:
-            f.write(batch_content)
+        self._write_file(batch_path, _START_BATCH)
         print(f"Created startup script: {batch_path}")
         
     def setup_server(self):
@@ -132,9 +148,13 @@ start dontstarve_dedicated_server_nullrenderer_x64 -console -cluster MyDediServe
             print("Starting Don't Starve Together server setup...")
             
             self.create_directories()
-            self.download_steamcmd()
-            self.create_server_config()
-            self.create_startup_script()
+            
+            # Download SteamCMD while the local config files are written
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                download = executor.submit(self.download_steamcmd)
+                self.create_server_config()
+                self.create_startup_script()
+                download.result()
             
             print("\nServer setup completed successfully!")
             print("\nIMPORTANT: Before starting the server:")
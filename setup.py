@@ -17,6 +17,9 @@ setup(
         "customtkinter>=5.2.0",
         "pillow>=10.0.0",  # Required by customtkinter
     ],
+    extras_require={
+        "fast": ["orjson>=3.9"],
+    },
     entry_points={
         "console_scripts": [
             "dst-server=dst_server_manager.cli:main",
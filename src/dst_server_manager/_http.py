@@ -0,0 +1,25 @@
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger('HTTP')
+
+# Shared session so Steam API, Workshop and CDN requests reuse pooled connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+SESSION.headers.update({'User-Agent': 'dst-server-manager/1.0'})
+
+# (connect, read) seconds for API calls, so a stalled Steam endpoint can't hang a worker
+TIMEOUT = (3, 10)
+
+def prime_connection(url: str = "https://api.steampowered.com/") -> None:
+    """Open a pooled connection to url ahead of a burst of requests"""
+    try:
+        SESSION.head(url, timeout=5)
+    except requests.RequestException as e:
+        logger.debug(f"Failed to prime connection to {url}: {e}")
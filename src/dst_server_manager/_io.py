@@ -0,0 +1,76 @@
+import os
+import logging
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Set
+
+logger = logging.getLogger('IO')
+
+# Shared worker pool for blocking file operations started from the GUI
+IO_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='dst-io')
+
+def run_in_background(widget, func: Callable, *args,
+                      on_result: Optional[Callable[[Any], None]] = None,
+                      on_error: Optional[Callable[[Exception], None]] = None,
+                      poll_ms: int = 50) -> Future:
+    """
+    Run func(*args) on the IO pool and deliver its outcome on the Tk thread
+    
+    The future is polled with widget.after(), so callbacks never run on the
+    worker thread. Callbacks are dropped if the widget is destroyed first.
+    """
+    future = IO_EXECUTOR.submit(func, *args)
+    
+    def poll():
+        try:
+            if not widget.winfo_exists():
+                return
+        except Exception:
+            return
+        if not future.done():
+            widget.after(poll_ms, poll)
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            if on_error:
+                on_error(e)
+            else:
+                logger.error(f"Background task {getattr(func, '__name__', func)} failed: {str(e)}")
+            return
+        if on_result:
+            on_result(result)
+    
+    widget.after(poll_ms, poll)
+    return future
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """
+    Atomically write data to path unless the file already holds exactly those bytes
+    
+    Returns True if the file was written.
+    """
+    path = Path(path)
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    # Write beside the target and swap it in, so a crash never leaves a half-written file
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
+
+def ensure_dir(path, created: Set[str]) -> None:
+    """os.makedirs(path, exist_ok=True), skipped for paths already in created"""
+    key = str(path)
+    if key in created:
+        return
+    os.makedirs(key, exist_ok=True)
+    created.add(key)
+
+def forget_dirs(path, created: Set[str]) -> None:
+    """Drop path and everything below it from created, after it was removed from disk"""
+    root = Path(path)
+    created.difference_update([key for key in created if Path(key) == root or root in Path(key).parents])
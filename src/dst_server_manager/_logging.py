@@ -0,0 +1,28 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+_listener = None
+
+def configure_logging() -> None:
+    """Send log records through a queue so the file/console writes happen on a background thread"""
+    global _listener
+    root = logging.getLogger()
+    # Like basicConfig, leave logging alone if something already configured it
+    if _listener is not None or root.handlers:
+        return
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [logging.FileHandler('dst_server_manager.log'), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    records = queue.Queue(-1)
+    _listener = QueueListener(records, *handlers)
+    _listener.start()
+    # Drain whatever is still queued when the interpreter exits
+    atexit.register(_listener.stop)
+
+    # Records are formatted by the listener's handlers, so the queue side gets no formatter
+    root.addHandler(QueueHandler(records))
+    root.setLevel(logging.DEBUG)
@@ -0,0 +1,23 @@
+from typing import Any, Callable, Dict
+
+_LUA_BOOL = {True: "true", False: "false"}
+
+# Exact-type formatters tried first; settings are almost always plain str/bool/int
+_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    str: lambda value: f'"{value}"',
+    bool: _LUA_BOOL.__getitem__,
+    int: str,
+    float: str,
+}
+
+def lua_value(value: Any) -> str:
+    """Format a scalar setting as a Lua literal"""
+    formatter = _FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    # Subclasses and other types
+    if isinstance(value, bool):
+        return _LUA_BOOL[value]
+    if isinstance(value, (int, float)):
+        return str(value)
+    return f'"{value}"'
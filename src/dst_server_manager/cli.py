@@ -5,6 +5,11 @@ import sys
 from dst_server_manager import ServerManager
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, install with the "fast" extra
+    orjson = None
+
 def create_parser():
     parser = argparse.ArgumentParser(description='Don\'t Starve Together Server Manager')
     subparsers = parser.add_subparsers(dest='command', help='Commands')
@@ -66,8 +71,11 @@ def create_parser():
     return parser
 
 def load_json_file(path: str) -> dict:
-    with open(path, 'r') as f:
-        return json.load(f)
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 def main():
     parser = create_parser()
@@ -1,7 +1,19 @@
-from .server_card import ServerCard
-from .save_card import SaveCard
-from .settings_tab import SettingsTab
-from .mods_tab import ModsTab
-from .import_dialog import ImportDialog
+import importlib
+
+# Components are loaded on first access so importing the package does not pull in Tk
+_COMPONENTS = {
+    'ServerCard': '.server_card',
+    'SaveCard': '.save_card',
+    'SettingsTab': '.settings_tab',
+    'ModsTab': '.mods_tab',
+    'ImportDialog': '.import_dialog',
+}
 
 __all__ = ['ServerCard', 'SaveCard', 'SettingsTab', 'ModsTab', 'ImportDialog']
+
+def __getattr__(name):
+    if name in _COMPONENTS:
+        value = getattr(importlib.import_module(_COMPONENTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
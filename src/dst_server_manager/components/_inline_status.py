@@ -0,0 +1,23 @@
+import customtkinter as ctk
+
+class InlineStatus:
+    """Mixin for tabs that show short-lived status messages in a label"""
+    # How long inline status messages stay visible
+    FLASH_MS = 1500
+
+    def _create_status_label(self, **pack_options):
+        """Create the inline status label, packed with pack_options"""
+        self.status_label = ctk.CTkLabel(self, text="")
+        self.status_label.pack(**pack_options)
+        self._flash_job = None
+
+    def _flash(self, message: str, color: str = "green"):
+        """Show a short-lived status message instead of a modal dialog"""
+        self.status_label.configure(text=message, text_color=color)
+        if self._flash_job is not None:
+            self.after_cancel(self._flash_job)
+        self._flash_job = self.after(self.FLASH_MS, self._clear_flash)
+
+    def _clear_flash(self):
+        self._flash_job = None
+        self.status_label.configure(text="")
@@ -1,8 +1,11 @@
 import customtkinter as ctk
 from tkinter import messagebox
 from typing import List, Dict, Any, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
 from .save_card import SaveCard
+from .._http import prime_connection
 import logging
+import threading
 
 logger = logging.getLogger('ImportDialog')
 
@@ -22,6 +25,14 @@ class ImportDialog:
         self.on_complete = on_complete
         self.selected_server = None
         self.cards = []
+        self._cards_by_name = {}
+        self._selected_card = None
+        # Set while the worker thread runs; the dialog can't be closed meanwhile
+        self._importing = False
+        
+        # Index servers by normalized name for O(1) lookups
+        self._current_name = str(current_server).strip()
+        self._servers_by_name = {str(s.get("name", "")).strip(): s for s in servers}
         
         # Configure window
         self.window.title("Import Save")
@@ -52,8 +63,9 @@ class ImportDialog:
         self.window.grab_set()
         self.window.focus_force()
         
-        # Bind escape key to close
-        self.window.bind('<Escape>', lambda e: self.destroy())
+        # Bind escape key and the window manager's close button to close
+        self.window.bind('<Escape>', lambda e: self._on_close())
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
     
     def _create_widgets(self):
         """Create dialog widgets"""
@@ -64,24 +76,26 @@ class ImportDialog:
         ctk.CTkLabel(header, text="Import World Save", 
                     font=("Arial", 24, "bold")).pack(side="left")
         
-        ctk.CTkButton(header, text="×", width=30, height=30,
-                     command=self.destroy).pack(side="right")
+        self.close_button = ctk.CTkButton(header, text="×", width=30, height=30,
+                                          command=self._on_close)
+        self.close_button.pack(side="right")
         
         # Cards container
         cards_frame = ctk.CTkScrollableFrame(self.container)
         cards_frame.pack(fill="both", expand=True)
         
-        # Create cards
-        for server in self.servers:
-            server_name = str(server.get("name", "")).strip()
-            current_name = str(self.current_server).strip()
-            
-            if server_name == current_name:  # Skip current server
+        # Create all cards first, then lay them out in a single grid pass
+        for server_name, server in self._servers_by_name.items():
+            if server_name == self._current_name:  # Skip current server
                 continue
             
             card = SaveCard(cards_frame, server, self._on_select)
-            card.pack(padx=10, pady=5)
             self.cards.append(card)
+            self._cards_by_name[card.server_name] = card
+        
+        cards_frame.grid_columnconfigure(0, weight=1)
+        for row, card in enumerate(self.cards):
+            card.grid(row=row, column=0, padx=10, pady=5)
         
         # Progress bar (hidden initially)
         self.progress_frame = ctk.CTkFrame(self.container, fg_color="transparent")
@@ -109,13 +123,29 @@ class ImportDialog:
     
     def _on_select(self, server_name: str):
         """Handle server selection"""
-        self.selected_server = str(server_name)
-        for card in self.cards:
-            try:
-                is_selected = str(card.server_name).strip() == str(server_name).strip()
-                card.set_selected(is_selected)
-            except Exception as e:
-                logger.error(f"Error selecting card: {e}")
+        # Card names are already normalized by SaveCard
+        self.selected_server = server_name
+        previous = self._selected_card
+        card = self._cards_by_name.get(server_name)
+        if previous is card:
+            return
+        
+        try:
+            if previous is not None:
+                previous.set_selected(False)
+            if card is not None:
+                card.set_selected(True)
+                # Saves are listed without their mods; read them for the selected cluster
+                if self.manager and "mods" not in card.server_data and "/" in server_name:
+                    card.set_mods(self.manager.world_manager.get_save_mods(server_name))
+        except Exception as e:
+            logger.error(f"Error selecting card: {e}")
+        self._selected_card = card
+    
+    def _on_close(self):
+        """Close the dialog unless an import is still running"""
+        if not self._importing:
+            self.destroy()
     
     def _on_import(self):
         """Handle import button click"""
@@ -123,82 +153,106 @@ class ImportDialog:
             messagebox.showwarning("Warning", "Please select a server")
             return
         
+        # Find selected server data
+        selected_server = self._servers_by_name.get(self.selected_server)
+        if not selected_server:
+            messagebox.showerror("Error", f"Failed to import save: Server '{self.selected_server}' not found")
+            return
+        
+        self._start_import(selected_server)
+    
+    def _start_import(self, selected_server: Dict[str, Any]):
+        """Show the progress bar and run the import on a worker thread"""
+        self._importing = True
+        self.import_button.configure(state="disabled")
+        self.close_button.configure(state="disabled")
+        self.progress_frame.pack(fill="x", pady=(10, 0))
+        self._set_progress(0, "Importing save files...")
+        
+        threading.Thread(target=self._worker, args=(selected_server,), daemon=True).start()
+    
+    def _worker(self, selected_server: Dict[str, Any]):
+        """Import save files and mods; never touches widgets directly"""
         try:
-            # Find selected server data
-            selected_name = str(self.selected_server).strip()
-            selected_server = None
-            
-            # Look for server by name
-            for server in self.servers:
-                if str(server.get("name", "")).strip() == selected_name:
-                    selected_server = server
-                    break
-            
-            if not selected_server:
-                raise ValueError(f"Server '{selected_name}' not found")
+            # Handle both old and new mod formats
+            mods = []
+            mod_entries = selected_server.get("mods")
+            if self.manager and mod_entries is None and "/" in selected_server["name"]:
+                # Normally read when the card was selected
+                mod_entries = self.manager.world_manager.get_save_mods(selected_server["name"])
+            if self.manager and mod_entries:
+                for mod_entry in mod_entries:
+                    if isinstance(mod_entry, dict):
+                        mods.append((str(mod_entry.get('id', '')), mod_entry.get('config', {})))
+                    else:
+                        mods.append((str(mod_entry), {}))
+            mod_ids = [mod_id for mod_id, _ in mods if mod_id]
             
-            # Show progress bar
-            self.import_button.configure(state="disabled")
-            self.progress_frame.pack(fill="x", pady=(10, 0))
-            self.progress_bar.set(0)
-            self.progress_label.configure(text="Importing save files...")
-            self.window.update_idletasks()
+            if mod_ids:
+                # Open the TLS connection once so the concurrent fetches reuse it
+                prime_connection()
             
-            # Import save files
-            source_server = selected_server["name"]
-            self.import_callback(source_server, self.current_server)
-            
-            # Update progress
-            self.progress_bar.set(0.5)
-            self.progress_label.configure(text="Importing mods...")
-            self.window.update_idletasks()
-            
-            # Import mods if available
-            if self.manager and "mods" in selected_server:
-                total_mods = len(selected_server["mods"])
-                for i, mod_entry in enumerate(selected_server["mods"]):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Prefetch mod info while the save files are copied
+                prefetch = None
+                if self.manager and mod_ids:
+                    prefetch = executor.submit(self.manager.mod_manager._fetch_mod_infos, mod_ids)
+                
+                # Import save files
+                source_server = selected_server["name"]
+                self.import_callback(source_server, self.current_server)
+                self._post(self._set_progress, 0.5, "Importing mods...")
+                
+                # Import mods if available
+                if prefetch is not None:
+                    mod_infos = prefetch.result()
+                    self._post(self._set_progress, 0.75, f"Importing {len(mod_ids)} mods...")
                     try:
-                        # Handle both old and new mod formats
-                        if isinstance(mod_entry, dict):
-                            mod_id = str(mod_entry.get('id', ''))
-                            config = mod_entry.get('config', {})
-                        else:
-                            mod_id = str(mod_entry)
-                            config = {}
-                        
-                        if mod_id:
-                            # Fetch mod info to get proper name
-                            mod_info = self.manager.mod_manager._fetch_mod_info(mod_id)
-                            self.manager.mod_manager.add_mod(
-                                self.current_server, 
-                                mod_id,
-                                config
-                            )
-                            # Update progress
-                            progress = 0.5 + ((i + 1) / total_mods * 0.5)
-                            self.progress_bar.set(progress)
-                            self.progress_label.configure(text=f"Importing mod: {mod_info.get('name', f'Mod {mod_id}')}")
-                            self.window.update_idletasks()
+                        # One settings save and one rewrite of the server's mod files for all of them
+                        self.manager.mod_manager.add_mods(
+                            self.current_server,
+                            {mod_id: config for mod_id, config in mods if mod_id},
+                            mod_infos
+                        )
                     except Exception as e:
-                        logger.error(f"Failed to import mod {mod_id}: {e}")
-            
-            # Complete
-            self.progress_bar.set(1.0)
-            self.progress_label.configure(text="Import complete!")
-            self.window.update_idletasks()
-            
-            messagebox.showinfo("Success", "Save and mods imported successfully!")
-            
-            # Call completion callback if provided
-            if self.on_complete:
-                self.on_complete()
-            
-            self.destroy()
-            
+                        logger.error(f"Failed to import mods {', '.join(mod_ids)}: {e}")
         except Exception as e:
+            self._post(self._finish, e)
+        else:
+            self._post(self._finish, None)
+    
+    def _post(self, callback: Callable, *args):
+        """Schedule a callback on the Tk main thread"""
+        try:
+            self.window.after(0, callback, *args)
+        except Exception:
+            # Dialog was closed while the import was running
+            pass
+    
+    def _set_progress(self, progress: float, text: str):
+        """Update the progress bar and label"""
+        self.progress_bar.set(progress)
+        self.progress_label.configure(text=text)
+    
+    def _finish(self, error: Optional[Exception]):
+        """Report the import result on the main thread"""
+        self._importing = False
+        if error is not None:
             self.progress_frame.pack_forget()
             self.import_button.configure(state="normal")
-            messagebox.showerror("Error", f"Failed to import save: {str(e)}")
+            self.close_button.configure(state="normal")
+            messagebox.showerror("Error", f"Failed to import save: {str(error)}")
+            return
+        
+        # Complete
+        self._set_progress(1.0, "Import complete!")
+        messagebox.showinfo("Success", "Save and mods imported successfully!")
+        
+        # Call completion callback if provided
+        if self.on_complete:
+            self.on_complete()
+        
+        self.destroy()
     
     def destroy(self):
         """Clean up and destroy dialog"""
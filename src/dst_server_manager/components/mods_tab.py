@@ -2,16 +2,33 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
 import os
-from typing import Dict, Any
+from pathlib import Path
+from typing import Dict, Any, Optional
+from .._io import run_in_background
+from ._inline_status import InlineStatus
 
-class ModsTab(ctk.CTkFrame):
+class ModsTab(InlineStatus, ctk.CTkFrame):
     """Mods tab for server configuration"""
+    # Fixed row height of the virtualized list and the initial row pool size
+    ROW_HEIGHT = 44
+    ROW_POOL = 12
+    # Windows/macOS wheel event and the X11 wheel buttons
+    WHEEL_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+    
     def __init__(self, parent, server_name: str, manager):
         super().__init__(parent)
         self.server_name = server_name
         self.manager = manager
         
+        # Server mods as returned by get_server_mods, kept in sync with our own edits
+        self._mods_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._mod_names: Dict[str, str] = {}
+        
+        # Workshop download folder for DST (app 322330) mods
+        self._workshop_root = Path(self.manager.steamcmd_path) / "steamapps" / "workshop" / "content" / "322330"
+        
         self._create_add_section()
+        self._create_status_label(fill="x", padx=5)
         self._create_mods_list()
         
         # Load initial mods
@@ -32,51 +49,206 @@ class ModsTab(ctk.CTkFrame):
                      command=self.add_mod).pack(side="right", padx=5)
     
     def _create_mods_list(self):
-        """Create the scrollable mods list"""
-        self.mods_list = ctk.CTkScrollableFrame(self)
-        self.mods_list.pack(fill="both", expand=True, padx=5, pady=5)
+        """Create the virtualized mods list"""
+        list_frame = ctk.CTkFrame(self)
+        list_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        
+        # Only enough rows to fill the viewport are created; scrolling retargets them
+        bg_color = list_frame.cget("fg_color")
+        if isinstance(bg_color, (list, tuple)):
+            bg_color = bg_color[1 if ctk.get_appearance_mode() == "Dark" else 0]
+        self.mods_canvas = tk.Canvas(list_frame, highlightthickness=0, bd=0, bg=bg_color,
+                                     yscrollincrement=self.ROW_HEIGHT)
+        self.mods_scrollbar = ctk.CTkScrollbar(list_frame, command=self.mods_canvas.yview)
+        self.mods_scrollbar.pack(side="right", fill="y")
+        self.mods_canvas.pack(side="left", fill="both", expand=True)
+        self.mods_canvas.configure(yscrollcommand=self._on_canvas_scroll)
+        
+        self.mods_canvas.bind("<Configure>", self._on_canvas_configure)
+        # Wheel events go to the widget under the pointer (often a row), so the
+        # handler is bound globally only while the pointer is over this list
+        self._wheel_bound = False
+        self.mods_canvas.bind("<Enter>", self._on_canvas_enter)
+        self.mods_canvas.bind("<Leave>", self._on_canvas_leave)
+        self.bind("<Destroy>", self._on_destroy, add="+")
+        
+        # Mods model and the pool of row widgets rendering it
+        self._mods = []
+        self._row_pool = []
+        self._ensure_row_pool(self.ROW_POOL)
     
-    def refresh_mods(self):
-        """Refresh the mods list"""
+    def _get_mods(self) -> Dict[str, Dict[str, Any]]:
+        """Get the server's mods, loading them from the mod manager on first use"""
+        if self._mods_cache is None:
+            self._mods_cache = self.manager.mod_manager.get_server_mods(self.server_name)
+        return self._mods_cache
+    
+    def refresh_mods(self, reload: bool = True):
+        """Refresh the mods list
+
+        Pass reload=False when the cache already reflects the change being shown.
+        """
         try:
-            # Clear existing mods
-            for widget in self.mods_list.winfo_children():
-                widget.destroy()
+            if reload:
+                self._mods_cache = None
             
             # Get mods and their configurations
-            mods = self.manager.mod_manager.get_server_mods(self.server_name)
+            mods = self._get_mods()
+            server_settings = self.manager.mod_manager.mod_settings.get('servers', {}).get(self.server_name, {})
+            self._mod_names = {
+                mod_id: server_settings.get(mod_id, {}).get('name', f"Mod {mod_id}")
+                for mod_id in mods
+            }
+            self._mods = list(mods.items())
             
-            # Create a row for each mod
-            for mod_id, mod_config in mods.items():
-                self._create_mod_row(mod_id, mod_config)
+            width = self.mods_canvas.winfo_width()
+            self.mods_canvas.configure(scrollregion=(0, 0, width, len(self._mods) * self.ROW_HEIGHT))
+            self._update_viewport(rebind=True)
         except Exception as e:
             print(f"Error refreshing mods: {str(e)}")
     
-    def _create_mod_row(self, mod_id: str, mod_config: Dict[str, Any]):
-        """Create a row for a mod in the list"""
-        mod_frame = ctk.CTkFrame(self.mods_list)
-        mod_frame.pack(fill="x", padx=5, pady=2)
+    def _ensure_row_pool(self, size: int):
+        """Grow the row pool to at least size rows"""
+        while len(self._row_pool) < size:
+            row = self._create_mod_row(len(self._row_pool))
+            row['window'] = self.mods_canvas.create_window(
+                0, 0, anchor="nw", window=row['frame'],
+                width=self.mods_canvas.winfo_width(),
+                height=self.ROW_HEIGHT - 4, state="hidden")
+            self._row_pool.append(row)
+    
+    def _update_viewport(self, rebind: bool = False):
+        """Point the pooled rows at the mods currently in view"""
+        top = max(0, int(self.mods_canvas.canvasy(0) // self.ROW_HEIGHT))
+        for k, row in enumerate(self._row_pool):
+            index = top + k
+            if index < len(self._mods):
+                mod_id, mod_config = self._mods[index]
+                if rebind or row['mod_id'] != mod_id:
+                    self._bind_mod_row(row, mod_id, mod_config)
+                self.mods_canvas.coords(row['window'], 0, index * self.ROW_HEIGHT + 2)
+                self.mods_canvas.itemconfigure(row['window'], state="normal")
+            else:
+                row['mod_id'] = None
+                self.mods_canvas.itemconfigure(row['window'], state="hidden")
+    
+    def _on_canvas_scroll(self, first, last):
+        """Sync the scrollbar and re-render after the view moves"""
+        self.mods_scrollbar.set(first, last)
+        self._update_viewport()
+    
+    def _on_canvas_configure(self, event):
+        """Resize rows to the canvas and grow the pool to cover its height"""
+        self._ensure_row_pool(event.height // self.ROW_HEIGHT + 2)
+        for row in self._row_pool:
+            self.mods_canvas.itemconfigure(row['window'], width=event.width)
+        self.mods_canvas.configure(scrollregion=(0, 0, event.width, len(self._mods) * self.ROW_HEIGHT))
+        self._update_viewport()
+    
+    def _is_list_widget(self, widget) -> bool:
+        canvas_path, widget_path = str(self.mods_canvas), str(widget)
+        return widget_path == canvas_path or widget_path.startswith(canvas_path + ".")
+    
+    def _bind_wheel(self, bound: bool):
+        if bound == self._wheel_bound:
+            return
+        for sequence in self.WHEEL_EVENTS:
+            if bound:
+                self.mods_canvas.bind_all(sequence, self._on_mousewheel)
+            else:
+                self.mods_canvas.unbind_all(sequence)
+        self._wheel_bound = bound
+    
+    def _on_canvas_enter(self, event):
+        self._bind_wheel(True)
+    
+    def _on_canvas_leave(self, event):
+        # The canvas also gets <Leave> when the pointer moves onto one of its rows
+        try:
+            widget = self.winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            widget = None
+        if widget is None or not self._is_list_widget(widget):
+            self._bind_wheel(False)
+    
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self._bind_wheel(False)
+    
+    def _on_mousewheel(self, event):
+        """Scroll the list when the wheel is used over the canvas or its rows"""
+        if not self._is_list_widget(event.widget):
+            return
+        if getattr(event, 'num', None) == 4 or event.delta > 0:
+            self.mods_canvas.yview_scroll(-1, "units")
+        else:
+            self.mods_canvas.yview_scroll(1, "units")
+    
+    def _create_mod_row(self, index: int) -> Dict[str, Any]:
+        """Create a reusable row for a mod in the list
+
+        Commands are bound once to the pool index; they look up the row's current mod.
+        """
+        mod_frame = ctk.CTkFrame(self.mods_canvas)
         
         # Enable/Disable checkbox
-        enabled = ctk.CTkCheckBox(mod_frame, text="", width=60)
+        enabled = ctk.CTkCheckBox(mod_frame, text="", width=60,
+                                  command=lambda: self._on_row_toggle(index))
         enabled.pack(side="left", padx=5)
-        if mod_config.get('enabled', True):
-            enabled.select()
-        enabled.configure(command=lambda: self.toggle_mod(mod_id, enabled.get()))
         
         # Mod info
-        mod_name = self.manager.mod_manager.mod_settings.get('servers', {}).get(self.server_name, {}).get(mod_id, {}).get('name', f"Mod {mod_id}")
-        ctk.CTkLabel(mod_frame, text=f"{mod_name} ({mod_id})").pack(side="left", padx=5)
+        label = ctk.CTkLabel(mod_frame, text="")
+        label.pack(side="left", padx=5)
         
         # Remove button
-        ctk.CTkButton(mod_frame, text="Remove",
-                     command=lambda: self.remove_mod(mod_id),
-                     fg_color="darkred", width=80).pack(side="right", padx=5)
+        remove_button = ctk.CTkButton(mod_frame, text="Remove",
+                                      command=lambda: self._on_row_remove(index),
+                                      fg_color="darkred", width=80)
+        remove_button.pack(side="right", padx=5)
         
         # Configure button
-        ctk.CTkButton(mod_frame, text="Configure",
-                     command=lambda: self.open_mod_folder(mod_id),
-                     width=80).pack(side="right", padx=5)
+        configure_button = ctk.CTkButton(mod_frame, text="Configure",
+                                         command=lambda: self._on_row_configure(index),
+                                         width=80)
+        configure_button.pack(side="right", padx=5)
+        
+        return {
+            'frame': mod_frame,
+            'checkbox': enabled,
+            'label': label,
+            'remove_button': remove_button,
+            'configure_button': configure_button,
+            'window': None,
+            'mod_id': None
+        }
+    
+    def _bind_mod_row(self, row: Dict[str, Any], mod_id: str, mod_config: Dict[str, Any]):
+        """Point a pooled row at a mod"""
+        row['mod_id'] = mod_id
+        
+        enabled = row['checkbox']
+        if mod_config.get('enabled', True):
+            enabled.select()
+        else:
+            enabled.deselect()
+        
+        mod_name = self._mod_names.get(mod_id, f"Mod {mod_id}")
+        row['label'].configure(text=f"{mod_name} ({mod_id})")
+    
+    def _on_row_toggle(self, index: int):
+        row = self._row_pool[index]
+        if row['mod_id'] is not None:
+            self.toggle_mod(row['mod_id'], row['checkbox'].get())
+    
+    def _on_row_remove(self, index: int):
+        mod_id = self._row_pool[index]['mod_id']
+        if mod_id is not None:
+            self.remove_mod(mod_id)
+    
+    def _on_row_configure(self, index: int):
+        mod_id = self._row_pool[index]['mod_id']
+        if mod_id is not None:
+            self.open_mod_folder(mod_id)
     
     def add_mod(self):
         """Add a mod to the server"""
@@ -95,24 +267,24 @@ class ModsTab(ctk.CTkFrame):
             }
             
             # Add the mod
-            self.manager.mod_manager._fetch_mod_info = lambda x: mod_info
-            self.manager.mod_manager.add_mod(self.server_name, mod_id)
+            self.manager.mod_manager.add_mod(self.server_name, mod_id, mod_info=mod_info)
+            self._get_mods()[mod_id] = {'enabled': True, 'configuration_options': {}}
             
             # Clear inputs and refresh
             self.mod_id_entry.delete(0, tk.END)
             self.mod_name_entry.delete(0, tk.END)
-            self.refresh_mods()
+            self.refresh_mods(reload=False)
             
             # Show success message
-            messagebox.showinfo("Success", f"Mod {mod_name} ({mod_id}) added!")
+            self._flash(f"Mod {mod_name} ({mod_id}) added!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to add mod: {str(e)}")
     
     def toggle_mod(self, mod_id: str, enabled: bool):
         """Toggle mod enabled/disabled state"""
         try:
-            current_config = self.manager.mod_manager.get_server_mods(self.server_name).get(mod_id, {})
-            current_config['enabled'] = enabled
+            current_config = self._get_mods().setdefault(mod_id, {})
+            current_config['enabled'] = bool(enabled)
             self.manager.mod_manager.update_mod_config(self.server_name, mod_id, current_config)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to update mod state: {str(e)}")
@@ -126,29 +298,26 @@ class ModsTab(ctk.CTkFrame):
             
             # Remove mod
             self.manager.mod_manager.remove_mod(self.server_name, mod_id)
+            self._get_mods().pop(mod_id, None)
             
-            # Clear and refresh UI
-            for widget in self.mods_list.winfo_children():
-                widget.destroy()
-            self.refresh_mods()
+            # Refresh UI; the freed row is hidden and kept for reuse
+            self.refresh_mods(reload=False)
             
-            messagebox.showinfo("Success", f"Mod {mod_id} removed!")
+            self._flash(f"Mod {mod_id} removed!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to remove mod: {str(e)}")
     
     def open_mod_folder(self, mod_id: str):
         """Open the mod folder"""
-        try:
-            mod_path = os.path.join(self.manager.steamcmd_path, 
-                                  "steamapps", 
-                                  "workshop",
-                                  "content",
-                                  "322330",  # DST App ID
-                                  mod_id)
-            
-            if os.path.exists(mod_path):
-                os.startfile(mod_path)
-            else:
+        def open_folder(mod_path: Path) -> bool:
+            if not mod_path.exists():
+                return False
+            os.startfile(os.fspath(mod_path))
+            return True
+        
+        def on_result(found: bool):
+            if not found:
                 messagebox.showwarning("Warning", "Mod folder not found. The mod may not be downloaded yet.")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to open mod folder: {str(e)}")
+        
+        run_in_background(self, open_folder, self._workshop_root / mod_id, on_result=on_result,
+                          on_error=lambda e: messagebox.showerror("Error", f"Failed to open mod folder: {str(e)}"))
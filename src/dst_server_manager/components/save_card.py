@@ -2,6 +2,17 @@ import customtkinter as ctk
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+# Overworld fields shown on the card, in display order
+_MASTER_FIELDS = (
+    ("day", "Day {}"),
+    ("season", "Season: {}"),
+)
+_TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+def _format_playtime(playtime: float) -> str:
+    hours, minutes = divmod(int(playtime), 60)
+    return f"Playtime: {hours}h {minutes}m"
+
 class SaveCard(ctk.CTkFrame):
     """A card widget displaying save information"""
     def __init__(self, parent, server_data: Dict[str, Any], on_select: callable):
@@ -9,15 +20,15 @@ class SaveCard(ctk.CTkFrame):
         
         # Store server data
         self.server_data = server_data
-        self.server_name = str(server_data.get("name", ""))
+        self.server_name = str(server_data.get("name", "")).strip()
         
-        # Create card text
-        card_text = self._format_save_info(server_data)
+        # Create card text once; it does not change with selection
+        self.card_text = self._format_save_info(server_data)
         
         # Create button that fills the frame
         self.button = ctk.CTkButton(
             self,
-            text="\n".join(card_text),
+            text=self.card_text,
             command=lambda: on_select(self.server_name),
             width=700,
             height=150,
@@ -28,41 +39,41 @@ class SaveCard(ctk.CTkFrame):
         )
         self.button.pack(fill="both", expand=True)
     
-    def _format_save_info(self, server_data: Dict[str, Any]) -> list[str]:
-        """Format save information into text lines"""
+    def _format_save_info(self, server_data: Dict[str, Any]) -> str:
+        """Format save information into the card text"""
         text_lines = [server_data["name"]]
         
         # Add last save time
         if server_data["last_save"]:
-            save_time = datetime.fromtimestamp(server_data["last_save"])
-            time_str = save_time.strftime("%Y-%m-%d %H:%M")
+            time_str = datetime.fromtimestamp(server_data["last_save"]).strftime(_TIME_FORMAT)
             text_lines.append(f"Last Save: {time_str}")
         
         # Add overworld info
-        if server_data["master"]:
+        master = server_data["master"]
+        if master:
             text_lines.append("\nOverworld:")
-            if "day" in server_data["master"]:
-                text_lines.append(f"Day {server_data['master']['day']}")
-            if "season" in server_data["master"]:
-                text_lines.append(f"Season: {server_data['master']['season']}")
-            if "playtime" in server_data["master"]:
-                hours = int(server_data["master"]["playtime"] // 60)
-                minutes = int(server_data["master"]["playtime"] % 60)
-                text_lines.append(f"Playtime: {hours}h {minutes}m")
+            text_lines += [fmt.format(master[key]) for key, fmt in _MASTER_FIELDS if key in master]
+            if "playtime" in master:
+                text_lines.append(_format_playtime(master["playtime"]))
         
         # Add caves info
-        if server_data["caves"]:
+        caves = server_data["caves"]
+        if caves:
             text_lines.append("\nCaves:")
-            if "playtime" in server_data["caves"]:
-                hours = int(server_data["caves"]["playtime"] // 60)
-                minutes = int(server_data["caves"]["playtime"] % 60)
-                text_lines.append(f"Playtime: {hours}h {minutes}m")
+            if "playtime" in caves:
+                text_lines.append(_format_playtime(caves["playtime"]))
         
         # Add mod info
-        if "mods" in server_data and server_data["mods"]:
+        if server_data.get("mods"):
             text_lines.append(f"\nMods: {len(server_data['mods'])} installed")
         
-        return text_lines
+        return "\n".join(text_lines)
+    
+    def set_mods(self, mods: Dict[str, Any]):
+        """Attach mods read after the card was built and show their count"""
+        self.server_data["mods"] = mods
+        self.card_text = self._format_save_info(self.server_data)
+        self.button.configure(text=self.card_text)
     
     def set_selected(self, selected: bool):
         """Update card appearance based on selection state"""
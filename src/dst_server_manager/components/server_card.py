@@ -9,51 +9,91 @@ class ServerCard(ctk.CTkFrame):
         
         self.server_name = server_name
         self.server_info = server_info
+        self._on_start = on_start
+        self._on_stop = on_stop
+        self._running = None
         
         self._create_title_section()
         self._create_details_section()
-        self._create_action_buttons(on_configure, on_start, on_stop)
+        self._create_action_buttons(on_configure)
+        self.update_status(server_info)
     
     def _create_title_section(self):
         """Create the title section with server name and status"""
         title_frame = ctk.CTkFrame(self)
         title_frame.pack(fill="x", padx=10, pady=5)
         
-        ctk.CTkLabel(title_frame, text=self.server_info['name'], 
-                    font=("Arial", 16, "bold")).pack(side="left")
+        self.name_label = ctk.CTkLabel(title_frame, text=self.server_info['name'], 
+                                       font=("Arial", 16, "bold"))
+        self.name_label.pack(side="left")
         
-        status_color = "green" if self.server_info['running'] else "gray"
-        status_text = "Running" if self.server_info['running'] else "Stopped"
-        ctk.CTkLabel(title_frame, text=status_text, 
-                    text_color=status_color).pack(side="right")
+        self.status_label = ctk.CTkLabel(title_frame, text="")
+        self.status_label.pack(side="right")
     
     def _create_details_section(self):
         """Create the details section with server information"""
         details_frame = ctk.CTkFrame(self)
         details_frame.pack(fill="x", padx=10, pady=5)
         
-        ctk.CTkLabel(details_frame, text=self.server_info['description']).pack(anchor="w")
-        ctk.CTkLabel(details_frame, 
-                    text=f"Game Mode: {self.server_info['game_mode']} | Players: {self.server_info['max_players']}").pack(anchor="w")
+        self.description_label = ctk.CTkLabel(details_frame, text="")
+        self.description_label.pack(anchor="w")
+        self.mode_label = ctk.CTkLabel(details_frame, text="")
+        self.mode_label.pack(anchor="w")
         
-        if self.server_info['running'] and self.server_info['uptime'] is not None:
-            hours = int(self.server_info['uptime'] // 3600)
-            minutes = int((self.server_info['uptime'] % 3600) // 60)
-            ctk.CTkLabel(details_frame, 
-                        text=f"Uptime: {hours}h {minutes}m").pack(anchor="w")
+        # Only packed while the server reports an uptime
+        self.uptime_label = ctk.CTkLabel(details_frame, text="")
     
-    def _create_action_buttons(self, on_configure: Callable, on_start: Callable, on_stop: Callable):
+    def _create_action_buttons(self, on_configure: Callable):
         """Create action buttons for server control"""
         button_frame = ctk.CTkFrame(self)
         button_frame.pack(fill="x", padx=10, pady=5)
+        button_frame.grid_columnconfigure(1, weight=1)
         
         ctk.CTkButton(button_frame, text="Configure",
-                     command=lambda: on_configure(self.server_name)).pack(side="left", padx=5)
+                     command=lambda: on_configure(self.server_name)).grid(row=0, column=0, padx=5, pady=5, sticky="w")
         
-        if self.server_info['running']:
-            ctk.CTkButton(button_frame, text="Stop Server",
-                         command=lambda: on_stop(self.server_name),
-                         fg_color="darkred").pack(side="right", padx=5)
+        # A single start/stop button, reconfigured when the running state changes
+        self._default_button_color = ctk.ThemeManager.theme["CTkButton"]["fg_color"]
+        self.start_stop_button = ctk.CTkButton(button_frame, text="Start Server")
+        self.start_stop_button.grid(row=0, column=2, padx=5, pady=5, sticky="e")
+    
+    def rebind(self, server_name: str, server_info: Dict[str, Any]):
+        """Point a recycled card at a different server"""
+        self.server_name = server_name
+        # Force the start/stop button to be reconfigured for the new server
+        self._running = None
+        self.update_status(server_info)
+    
+    def update_status(self, server_info: Dict[str, Any]):
+        """Refresh the card in place from a get_server_status result"""
+        self.server_info = server_info
+        self.name_label.configure(text=server_info['name'])
+        self.description_label.configure(text=server_info['description'])
+        self.mode_label.configure(
+            text=f"Game Mode: {server_info['game_mode']} | Players: {server_info['max_players']}")
+        
+        if server_info['running'] and server_info['uptime'] is not None:
+            hours = int(server_info['uptime'] // 3600)
+            minutes = int((server_info['uptime'] % 3600) // 60)
+            self.uptime_label.configure(text=f"Uptime: {hours}h {minutes}m")
+            if not self.uptime_label.winfo_manager():
+                self.uptime_label.pack(anchor="w")
+        elif self.uptime_label.winfo_manager():
+            self.uptime_label.pack_forget()
+        
+        self._apply_running_state(server_info['running'])
+    
+    def _apply_running_state(self, running: bool):
+        """Switch the status label and start/stop button without rebuilding the card"""
+        if running == self._running:
+            return
+        self._running = running
+        
+        self.status_label.configure(text="Running" if running else "Stopped",
+                                    text_color="green" if running else "gray")
+        if running:
+            self.start_stop_button.configure(text="Stop Server", fg_color="darkred",
+                                             command=lambda: self._on_stop(self.server_name))
         else:
-            ctk.CTkButton(button_frame, text="Start Server",
-                         command=lambda: on_start(self.server_name)).pack(side="right", padx=5)
+            self.start_stop_button.configure(text="Start Server", fg_color=self._default_button_color,
+                                             command=lambda: self._on_start(self.server_name))
@@ -2,46 +2,115 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
 import os
-from pathlib import Path
+import json
+import logging
 from typing import Dict, Any, Callable
+from .._io import run_in_background
+from ._inline_status import InlineStatus
 
-class SettingsTab(ctk.CTkFrame):
+logger = logging.getLogger('SettingsTab')
+
+# Static widget definitions shared by every tab
+_BASIC_SETTINGS = (
+    ("name", "Server Name"),
+    ("description", "Description"),
+    ("max_players", "Max Players"),
+    ("password", "Password (optional)"),
+)
+_GAME_MODES = ("survival", "endless", "wilderness")
+_WORLD_PRESETS = ("default", "endless", "wilderness")
+
+# Reader/writer pairs for each kind of settings widget
+def _read_entry(widget):
+    return widget.get()
+
+def _write_entry(widget, value):
+    widget.delete(0, tk.END)
+    widget.insert(0, str(value))
+
+def _read_int_entry(widget):
+    try:
+        return int(widget.get())
+    except ValueError:
+        return 6  # Default value if invalid
+
+def _read_checkbox(widget):
+    return bool(widget.get())
+
+def _write_checkbox(widget, value):
+    widget.select() if value else widget.deselect()
+
+def _read_combobox(widget):
+    return widget.get()
+
+def _write_combobox(widget, value):
+    widget.set(str(value))
+
+class SettingsTab(InlineStatus, ctk.CTkFrame):
     """Settings tab for server configuration"""
+    # Delay before a save is written, so repeated saves collapse into one
+    SAVE_DEBOUNCE_MS = 200
+    
     def __init__(self, parent, server_name: str, manager, on_save: Callable = None):
         super().__init__(parent)
         self.server_name = server_name
         self.manager = manager
         self.on_save = on_save
         self.settings_widgets = {}
+        # key -> (widget, read, write), filled by _register_setting
+        self._setting_io = {}
+        
+        # Debounced save state
+        self._save_job = None
+        self._pending_save = None
+        self._last_saved = None
+        self._config_hash = None
+        
+        # Widgets are built the first time the tab is shown
+        self._built = False
+        self.bind("<Map>", self._on_map, add="+")
+        self.bind("<Destroy>", self._on_destroy, add="+")
+    
+    def _on_map(self, event):
+        if event.widget is self:
+            self._materialize()
+    
+    def _materialize(self):
+        """Build the tab's widgets and load its state, once"""
+        if self._built:
+            return
+        self._built = True
         
         self._create_basic_settings()
         self._create_game_settings()
         self._create_cluster_token()
         self._create_control_buttons()
         self._create_action_buttons()
+        self._create_status_label(padx=5, pady=5, fill="x")
         
         # Load initial configuration
         self.load_config()
+        self._load_token()
         
-        # Start periodic status updates
-        self.after(1000, self.update_control_buttons)
+        # Follow server status changes instead of polling
+        self.update_control_buttons()
+        self.manager.add_status_listener(self.server_name, self._on_status_change)
     
     def _create_basic_settings(self):
         """Create basic server settings section"""
-        basic_settings = [
-            ("name", "Server Name"),
-            ("description", "Description"),
-            ("max_players", "Max Players"),
-            ("password", "Password (optional)"),
-        ]
-        
-        for key, label in basic_settings:
+        # Build every row before packing any, so the tab is laid out once
+        frames = []
+        for key, label in _BASIC_SETTINGS:
             frame = ctk.CTkFrame(self)
-            frame.pack(padx=5, pady=5, fill="x")
             ctk.CTkLabel(frame, text=label).pack(side="left", padx=5)
             entry = ctk.CTkEntry(frame)
             entry.pack(side="right", padx=5, expand=True, fill="x")
-            self.settings_widgets[key] = entry
+            read = _read_int_entry if key == "max_players" else _read_entry
+            self._register_setting(key, entry, read, _write_entry)
+            frames.append(frame)
+        
+        for frame in frames:
+            frame.pack(padx=5, pady=5, fill="x")
     
     def _create_game_settings(self):
         """Create game mode and world preset settings"""
@@ -49,29 +118,34 @@ class SettingsTab(ctk.CTkFrame):
         frame = ctk.CTkFrame(self)
         frame.pack(padx=5, pady=5, fill="x")
         ctk.CTkLabel(frame, text="Game Mode").pack(side="left", padx=5)
-        self.settings_widgets["game_mode"] = ctk.CTkComboBox(
-            frame, values=["survival", "endless", "wilderness"])
-        self.settings_widgets["game_mode"].pack(side="right", padx=5)
+        game_mode = ctk.CTkComboBox(frame, values=_GAME_MODES)
+        game_mode.pack(side="right", padx=5)
+        self._register_setting("game_mode", game_mode, _read_combobox, _write_combobox)
         
         # World preset selection
         frame = ctk.CTkFrame(self)
         frame.pack(padx=5, pady=5, fill="x")
         ctk.CTkLabel(frame, text="World Preset").pack(side="left", padx=5)
-        self.settings_widgets["world_preset"] = ctk.CTkComboBox(
-            frame, values=["default", "endless", "wilderness"])
-        self.settings_widgets["world_preset"].pack(side="right", padx=5)
+        world_preset = ctk.CTkComboBox(frame, values=_WORLD_PRESETS)
+        world_preset.pack(side="right", padx=5)
+        self._register_setting("world_preset", world_preset, _read_combobox, _write_combobox)
         
         # Checkboxes
         checkbox_frame = ctk.CTkFrame(self)
         checkbox_frame.pack(padx=5, pady=5, fill="x")
         
-        self.settings_widgets["pvp"] = ctk.CTkCheckBox(
-            checkbox_frame, text="PvP")
-        self.settings_widgets["pvp"].pack(side="left", padx=20)
+        pvp = ctk.CTkCheckBox(checkbox_frame, text="PvP")
+        pvp.pack(side="left", padx=20)
+        self._register_setting("pvp", pvp, _read_checkbox, _write_checkbox)
         
-        self.settings_widgets["pause_when_empty"] = ctk.CTkCheckBox(
-            checkbox_frame, text="Pause When Empty")
-        self.settings_widgets["pause_when_empty"].pack(side="left", padx=20)
+        pause_when_empty = ctk.CTkCheckBox(checkbox_frame, text="Pause When Empty")
+        pause_when_empty.pack(side="left", padx=20)
+        self._register_setting("pause_when_empty", pause_when_empty, _read_checkbox, _write_checkbox)
+    
+    def _register_setting(self, key: str, widget, read: Callable, write: Callable):
+        """Track a settings widget with the functions that read and write its value"""
+        self.settings_widgets[key] = widget
+        self._setting_io[key] = (widget, read, write)
     
     def _create_cluster_token(self):
         """Create cluster token input section"""
@@ -81,12 +155,15 @@ class SettingsTab(ctk.CTkFrame):
         ctk.CTkLabel(token_frame, text="Cluster Token").pack(side="left", padx=5)
         self.cluster_token_entry = ctk.CTkEntry(token_frame)
         self.cluster_token_entry.pack(side="right", padx=5, expand=True, fill="x")
+    
+    def _load_token(self):
+        """Load cluster token if exists"""
+        def insert_token(token: str):
+            if token:
+                self.cluster_token_entry.insert(0, token)
         
-        # Load cluster token if exists
-        token_path = Path(self.manager.base_path) / self.server_name / "cluster_token.txt"
-        if token_path.exists():
-            with open(token_path, 'r') as f:
-                self.cluster_token_entry.insert(0, f.read().strip())
+        run_in_background(self, self.manager.config_manager.get_server_token, self.server_name,
+                          on_result=insert_token)
     
     def _create_control_buttons(self):
         """Create server control buttons"""
@@ -123,88 +200,128 @@ class SettingsTab(ctk.CTkFrame):
     
     def load_config(self):
         """Load server configuration into the UI"""
+        if not self._built:
+            return  # Loaded by _materialize once the tab is shown
         try:
             config = self.manager.config_manager.get_server_config(self.server_name)
             
+            # Skip rewriting the widgets if the config is unchanged since the last load
+            config_hash = hash(json.dumps(config, sort_keys=True, default=str))
+            if config_hash == self._config_hash:
+                return
+            
             # Update settings widgets
-            for key, widget in self.settings_widgets.items():
+            for key, (widget, _, write) in self._setting_io.items():
                 if key in config:
-                    if isinstance(widget, ctk.CTkCheckBox):
-                        widget.select() if config[key] else widget.deselect()
-                    elif isinstance(widget, ctk.CTkComboBox):
-                        widget.set(str(config[key]))
-                    elif isinstance(widget, ctk.CTkEntry):
-                        widget.delete(0, tk.END)
-                        widget.insert(0, str(config[key]))
+                    write(widget, config[key])
+            self._config_hash = config_hash
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load server config: {str(e)}")
     
     def save_config(self):
-        """Save current configuration"""
+        """Save current configuration
+
+        Rapid repeated saves are coalesced; only the latest snapshot is written.
+        """
         try:
             # Save settings
             settings = {}
-            for key, widget in self.settings_widgets.items():
-                if isinstance(widget, ctk.CTkCheckBox):
-                    settings[key] = widget.get()
-                elif isinstance(widget, ctk.CTkComboBox):
-                    settings[key] = widget.get()
-                elif isinstance(widget, ctk.CTkEntry):
-                    value = widget.get()
-                    if key == "max_players":
-                        try:
-                            value = int(value)
-                        except ValueError:
-                            value = 6  # Default value if invalid
-                    # Don't update server name if it's empty
-                    if key == "name" and not value:
-                        continue
-                    settings[key] = value
+            for key, (widget, read, _) in self._setting_io.items():
+                value = read(widget)
+                # Don't update server name if it's empty
+                if key == "name" and not value:
+                    continue
+                settings[key] = value
             
-            # Update server configuration
-            try:
-                self.manager.update_server_config(self.server_name, settings)
-            except Exception as e:
-                logger.error(f"Failed to update server config: {str(e)}")
-                raise
+            self._pending_save = (settings, self.cluster_token_entry.get().strip())
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save config: {str(e)}")
+            return
+        
+        if self._save_job is not None:
+            self.after_cancel(self._save_job)
+        self._save_job = self.after(self.SAVE_DEBOUNCE_MS, self._flush_save)
+    
+    def _flush_save(self, notify: bool = True):
+        """Write the most recent configuration snapshot
+
+        notify=False skips the status message and on_save callback, for when the tab is going away.
+        """
+        self._save_job = None
+        if self._pending_save is None:
+            return
+        settings, token = self._pending_save
+        self._pending_save = None
+        
+        try:
+            # Update server configuration unless nothing changed since the last save
+            if settings != self._last_saved:
+                try:
+                    self.manager.update_server_config(self.server_name, settings)
+                except Exception as e:
+                    logger.error(f"Failed to update server config: {str(e)}")
+                    raise
+                self._last_saved = settings
             
             # Save cluster token
-            token = self.cluster_token_entry.get().strip()
             if token:
-                token_path = Path(self.manager.base_path) / self.server_name / "cluster_token.txt"
-                with open(token_path, 'w') as f:
-                    f.write(token)
+                self.manager.config_manager.set_server_token(self.server_name, token)
+            
+            if not notify:
+                return
             
-            messagebox.showinfo("Success", "Server configuration saved!")
+            self._flash("Server configuration saved!")
             
             if self.on_save:
                 self.on_save()
         except Exception as e:
+            if not notify:
+                logger.error(f"Failed to save config: {str(e)}")
+                return
             messagebox.showerror("Error", f"Failed to save config: {str(e)}")
     
     def update_control_buttons(self):
         """Update control button states based on server status"""
         try:
             status = self.manager.get_server_status(self.server_name)
-            if status['running']:
-                self.start_button.configure(state="disabled")
-                self.stop_button.configure(state="normal")
-            else:
-                self.start_button.configure(state="normal")
-                self.stop_button.configure(state="disabled")
+            self._set_running(status['running'])
         except Exception:
             # If there's an error getting status, disable both buttons
             self.start_button.configure(state="disabled")
             self.stop_button.configure(state="disabled")
-        
-        # Schedule next update
-        self.after(1000, self.update_control_buttons)
+    
+    def _set_running(self, running: bool):
+        """Enable the control button matching the server state"""
+        if running:
+            self.start_button.configure(state="disabled")
+            self.stop_button.configure(state="normal")
+        else:
+            self.start_button.configure(state="normal")
+            self.stop_button.configure(state="disabled")
+    
+    def _on_status_change(self, running: bool):
+        """Status listener; may run off the Tk thread so hand over via after()"""
+        try:
+            self.after(0, self._set_running, running)
+        except Exception:
+            # Tab is being destroyed
+            pass
+    
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self.manager.remove_status_listener(self.server_name, self._on_status_change)
+            # Write a save still waiting on the debounce before the tab disappears
+            if self._save_job is not None:
+                self.after_cancel(self._save_job)
+                self._save_job = None
+            if self._pending_save is not None:
+                self._flush_save(notify=False)
     
     def start_server(self):
         """Start the server"""
         try:
             self.manager.start_server(self.server_name)
-            messagebox.showinfo("Success", f"Server '{self.server_name}' started!")
+            self._flash(f"Server '{self.server_name}' started!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start server: {str(e)}")
     
@@ -212,17 +329,22 @@ class SettingsTab(ctk.CTkFrame):
         """Stop the server"""
         try:
             self.manager.stop_server(self.server_name)
-            messagebox.showinfo("Success", f"Server '{self.server_name}' stopped!")
+            self._flash(f"Server '{self.server_name}' stopped!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to stop server: {str(e)}")
     
     def open_world_folder(self):
         """Open the world folder"""
-        try:
-            server_path = os.path.join(self.manager.base_path, self.server_name)
-            if os.path.exists(server_path):
-                os.startfile(server_path)
-            else:
+        def open_folder(server_path: str) -> bool:
+            if not os.path.exists(server_path):
+                return False
+            os.startfile(server_path)
+            return True
+        
+        def on_result(found: bool):
+            if not found:
                 messagebox.showwarning("Warning", "Server folder not found")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to open folder: {str(e)}")
+        
+        server_path = os.path.join(self.manager.base_path, self.server_name)
+        run_in_background(self, open_folder, server_path, on_result=on_result,
+                          on_error=lambda e: messagebox.showerror("Error", f"Failed to open folder: {str(e)}"))
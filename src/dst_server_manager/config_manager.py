@@ -1,21 +1,80 @@
 import os
+import copy
+import json
 import yaml
 import shutil
+import hashlib
 import logging
+import functools
 import configparser
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set, Tuple
+from ._io import write_if_changed, ensure_dir, forget_dirs
+
+try:
+    # libyaml-backed loader/dumper, when PyYAML was built with it
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
 
 # Set up logging
 logger = logging.getLogger('ConfigManager')
 
+# Top-level scalar defaults, read directly without copying the full template
+_DEFAULTS_FLAT = {
+    'steamcmd_path': "C:\\steamcmd",
+    'cluster_token': "",
+}
+
+_DEFAULT_SERVER = {
+    'name': "My DST Server",
+    'description': "A Don't Starve Together Dedicated Server",
+    'game_mode': "survival",
+    'max_players': 6,
+    'pvp': False,
+    'pause_when_empty': True,
+    'password': "",
+    'server_port': 10999,
+    'master_server_port': 27018,
+    'authentication_port': 8768,
+    'world_overrides': {
+        'overworld': {},
+        'caves': {}
+    }
+}
+
+# Never mutated; get_default_config() hands out deep copies
+_DEFAULT_CONFIG = {
+    **_DEFAULTS_FLAT,
+    'servers': {
+        'default': _DEFAULT_SERVER
+    }
+}
+
+# Server settings rendered into cluster.ini; changes to other keys leave it untouched
+_CLUSTER_INI_KEYS = frozenset({
+    'game_mode', 'max_players', 'pvp', 'pause_when_empty', 'name', 'description', 'password'
+})
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; the stat fields in the key invalidate stale entries"""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_Loader)
+
 class ConfigManager:
     def __init__(self, base_path: Optional[str] = None):
         self.base_path = base_path or os.path.expanduser("~\\Documents\\Klei\\DoNotStarveTogether")
+        # Directories this manager has already created or confirmed
+        self._mkdir_cache: Set[str] = set()
         # Ensure base directory exists
-        os.makedirs(self.base_path, exist_ok=True)
+        self._ensure_dir(self.base_path)
         self.config_path = Path(self.base_path) / "server_config.yml"
         self.mod_settings_path = Path(self.base_path) / "mod_config.json"
+        # Per-server cluster_token.txt contents, validated by file mtime
+        self._token_cache: Dict[str, Tuple[float, str]] = {}
+        # Digest of the last YAML written, so unchanged saves skip the disk
+        self._last_saved_hash: Optional[bytes] = None
         # Initialize with default config
         self.config = self.get_default_config()
         # Load existing config if available
@@ -24,34 +83,45 @@ class ConfigManager:
     def load_config(self) -> None:
         """Load configuration from YAML file and merge with defaults"""
         try:
+            loaded_config = {}
+            migrated = False
             if self.config_path.exists():
-                with open(self.config_path, 'r') as f:
-                    loaded_config = yaml.safe_load(f) or {}
+                # Reuse the parsed file while it is unchanged on disk; copy before mutating
+                stat = self.config_path.stat()
+                loaded_config = copy.deepcopy(
+                    _load_yaml_cached(str(self.config_path), stat.st_mtime_ns, stat.st_size)) or {}
                 
             # Merge loaded config with defaults
             if loaded_config:
                 # Update top-level settings
-                self.config['steamcmd_path'] = loaded_config.get('steamcmd_path', self.config['steamcmd_path'])
-                self.config['cluster_token'] = loaded_config.get('cluster_token', self.config['cluster_token'])
+                self.config.update({key: loaded_config[key]
+                                    for key in _DEFAULTS_FLAT if key in loaded_config})
                 
                 # Merge server configurations
                 if 'servers' in loaded_config:
+                    servers = self.config['servers']
+                    # Shallow merge is safe: world_overrides is replaced per server below
+                    default_server_template = _DEFAULT_SERVER
+                    # Mod settings are read lazily on the first migration and written once after the loop
+                    mod_settings = None
                     for server_name, server_config in loaded_config['servers'].items():
-                        if server_name not in self.config['servers']:
-                            # Create new server config based on default
-                            self.config['servers'][server_name] = self.get_default_config()['servers']['default'].copy()
+                        base = servers.get(server_name)
+                        if base is None:
+                            # New server config based on default, with its own world_overrides
+                            base = {**default_server_template,
+                                    'world_overrides': {'overworld': {}, 'caves': {}}}
                         # Update server config with loaded values
-                        self.config['servers'][server_name].update(server_config)
+                        servers[server_name] = {**base, **server_config}
                         
                         # Handle migration of mods from old format
                         if 'mods' in server_config:
                             try:
-                                # Initialize mod settings for this server if needed
-                                mod_settings = {'servers': {}}
-                                if os.path.exists(self.mod_settings_path):
-                                    with open(self.mod_settings_path, 'r') as f:
-                                        mod_settings = json.load(f)
+                                if mod_settings is None:
+                                    mod_settings = {'servers': {}}
+                                    if os.path.exists(self.mod_settings_path):
+                                        mod_settings = json.loads(Path(self.mod_settings_path).read_bytes())
                                 
+                                # Initialize mod settings for this server if needed
                                 if server_name not in mod_settings['servers']:
                                     mod_settings['servers'][server_name] = {}
                                 
@@ -74,17 +144,20 @@ class ConfigManager:
                                             'configuration_options': {}
                                         }
                                 
-                                # Save updated mod settings
-                                with open(self.mod_settings_path, 'w') as f:
-                                    json.dump(mod_settings, f, indent=2)
-                                
                                 # Remove mods from server config as they're now in mod_settings
                                 del self.config['servers'][server_name]['mods']
+                                migrated = True
                             except Exception as e:
                                 logger.error(f"Failed to migrate mods for server {server_name}: {str(e)}")
+                    
+                    if migrated:
+                        # Save updated mod settings in one write
+                        write_if_changed(self.mod_settings_path,
+                                         json.dumps(mod_settings, indent=2).encode('utf-8'))
             
-            # Save merged configuration
-            self.save_config()
+            # Only write back when the merge or a migration changed what is on disk
+            if migrated or self.config != loaded_config:
+                self.save_config()
             
         except Exception as e:
             logger.error(f"Failed to load config: {str(e)}")
@@ -93,34 +166,27 @@ class ConfigManager:
 
     def save_config(self) -> None:
         """Save current configuration to YAML file"""
-        os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-        with open(self.config_path, 'w') as f:
-            yaml.safe_dump(self.config, f, default_flow_style=False)
+        buf = yaml.dump(self.config, Dumper=_Dumper, default_flow_style=False).encode()
+        digest = hashlib.blake2b(buf, digest_size=16).digest()
+        if digest == self._last_saved_hash:
+            return
+        self._ensure_dir(os.path.dirname(self.config_path))
+        with open(self.config_path, 'wb') as f:
+            f.write(buf)
+        self._last_saved_hash = digest
+        _load_yaml_cached.cache_clear()
+
+    def _ensure_dir(self, path) -> None:
+        """Create a directory once per manager instead of on every write"""
+        ensure_dir(path, self._mkdir_cache)
+
+    def forget_dirs(self, path) -> None:
+        """Forget created directories under path after it was deleted"""
+        forget_dirs(path, self._mkdir_cache)
 
     def get_default_config(self) -> Dict[str, Any]:
         """Return default configuration settings"""
-        return {
-            'steamcmd_path': "C:\\steamcmd",
-            'cluster_token': "",
-            'servers': {
-                'default': {
-                    'name': "My DST Server",
-                    'description': "A Don't Starve Together Dedicated Server",
-                    'game_mode': "survival",
-                    'max_players': 6,
-                    'pvp': False,
-                    'pause_when_empty': True,
-                    'password': "",
-                    'server_port': 10999,
-                    'master_server_port': 27018,
-                    'authentication_port': 8768,
-                    'world_overrides': {
-                        'overworld': {},
-                        'caves': {}
-                    }
-                }
-            }
-        }
+        return copy.deepcopy(_DEFAULT_CONFIG)
 
     def create_server_config(self, server_name: str) -> Dict[str, Any]:
         """Create a new server configuration"""
@@ -129,16 +195,15 @@ class ConfigManager:
         
         try:
             # Create base server config
-            default_server = self.get_default_config()['servers']['default'].copy()
+            default_server = copy.deepcopy(_DEFAULT_SERVER)
             default_server['name'] = server_name  # Set the actual server name
             self.config['servers'][server_name] = default_server
             self.save_config()
             
             # Create server directory structure
             server_path = Path(self.base_path) / server_name
-            os.makedirs(server_path, exist_ok=True)
-            os.makedirs(server_path / "Master", exist_ok=True)
-            os.makedirs(server_path / "Caves", exist_ok=True)
+            self._ensure_dir(server_path / "Master")
+            self._ensure_dir(server_path / "Caves")
             
             # Create cluster.ini
             self._create_cluster_ini(server_name)
@@ -158,6 +223,7 @@ class ConfigManager:
             server_path = Path(self.base_path) / server_name
             if server_path.exists():
                 shutil.rmtree(server_path)
+            self.forget_dirs(server_path)
             
             raise RuntimeError(f"Failed to create server configuration: {str(e)}")
 
@@ -166,12 +232,27 @@ class ConfigManager:
         if server_name not in self.config['servers']:
             raise ValueError(f"Server {server_name} does not exist")
         
+        # Only apply values that actually differ from the stored config
+        current = self.config['servers'][server_name]
+        delta = {key: value for key, value in settings.items() if current.get(key) != value}
+        cluster_ini_path = Path(self.base_path) / server_name / "cluster.ini"
+        if not delta and cluster_ini_path.exists():
+            return
+        
         # Update internal config
-        self.config['servers'][server_name].update(settings)
-        self.save_config()
+        current.update(delta)
+        if delta:
+            self.save_config()
         
         # Update cluster.ini
-        self._create_cluster_ini(server_name)
+        if not _CLUSTER_INI_KEYS.isdisjoint(delta) or not cluster_ini_path.exists():
+            self._create_cluster_ini(server_name)
+        
+        # Update server.ini for shards that already exist
+        if 'server_port' in delta:
+            for shard in ("Master", "Caves"):
+                if (Path(self.base_path) / server_name / shard).is_dir():
+                    self._create_server_ini(server_name, shard)
 
     def _create_cluster_ini(self, server_name: str) -> None:
         """Create or update cluster.ini file"""
@@ -202,10 +283,9 @@ class ConfigManager:
             "cluster_key = defaultkey"
         ]
         
-        # Write to file
+        # Write to file, leaving it untouched if nothing changed
         cluster_ini_path = Path(self.base_path) / server_name / "cluster.ini"
-        with open(cluster_ini_path, 'w', newline='\n') as f:
-            f.write('\n'.join(ini_content))
+        write_if_changed(cluster_ini_path, '\n'.join(ini_content).encode('utf-8'))
 
     def _create_server_ini(self, server_name: str, shard: str) -> None:
         """Create server.ini file for a shard"""
@@ -220,10 +300,9 @@ class ConfigManager:
             f"id = {shard.lower()}"
         ]
         
-        # Write to file
+        # Write to file, leaving it untouched if nothing changed
         server_ini_path = Path(self.base_path) / server_name / shard / "server.ini"
-        with open(server_ini_path, 'w', newline='\n') as f:
-            f.write('\n'.join(ini_content))
+        write_if_changed(server_ini_path, '\n'.join(ini_content).encode('utf-8'))
 
     def delete_server_config(self, server_name: str) -> None:
         """Delete a server configuration"""
@@ -252,3 +331,31 @@ class ConfigManager:
     def get_cluster_token(self) -> str:
         """Get the cluster token"""
         return self.config['cluster_token']
+
+    def get_server_token(self, server_name: str) -> str:
+        """Get the token stored in a server's cluster_token.txt, or "" if there is none"""
+        token_path = Path(self.base_path) / server_name / "cluster_token.txt"
+        try:
+            mtime = token_path.stat().st_mtime
+        except OSError:
+            self._token_cache.pop(server_name, None)
+            return ""
+        
+        # Reuse the cached token while the file is unchanged
+        cached = self._token_cache.get(server_name)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        # set_server_token writes UTF-8, so read it back the same way
+        token = token_path.read_bytes().decode('utf-8', errors='replace').strip()
+        self._token_cache[server_name] = (mtime, token)
+        return token
+
+    def set_server_token(self, server_name: str, token: str) -> None:
+        """Write a server's cluster_token.txt, skipping the write if it already holds token"""
+        if self.get_server_token(server_name) == token:
+            return
+        
+        token_path = Path(self.base_path) / server_name / "cluster_token.txt"
+        token_path.write_text(token, encoding='utf-8')
+        self._token_cache[server_name] = (token_path.stat().st_mtime, token)
@@ -1,12 +1,16 @@
-import customtkinter as ctk
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from dst_server_manager.server_manager import ServerManager
-from dst_server_manager.screens.server_list import ServerListScreen
-from dst_server_manager.screens.server_create import ServerCreateScreen
-from dst_server_manager.screens.server_config import ServerConfigScreen
+
+# customtkinter and the screen modules are imported on first use, so importing
+# this module stays cheap for headless callers
 
 class ServerManagerGUI:
+    # Built screens kept around for reuse, keyed by ("list",), ("create",) or ("config", server_name)
+    SCREEN_CACHE_SIZE = 4
+    
     def __init__(self):
+        import customtkinter as ctk
         self.manager = ServerManager()
         
         # Setup main window
@@ -18,45 +22,68 @@ class ServerManagerGUI:
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_rowconfigure(0, weight=1)
         
-        # Current screen
+        # Current screen and the cache of built screens, least recently shown first
         self.current_screen = None
+        self.screens: "OrderedDict[tuple, Any]" = OrderedDict()
         
         # Show initial screen
         self.switch_screen("list")
     
     def switch_screen(self, screen_name: str, **kwargs):
         """Switch to a different screen"""
-        # Remove current screen if exists
+        if screen_name == "config":
+            if "server_name" not in kwargs:
+                raise ValueError("server_name required for config screen")
+            key = ("config", kwargs["server_name"])
+        elif screen_name in ("list", "create"):
+            key = (screen_name,)
+        else:
+            raise ValueError(f"Unknown screen: {screen_name}")
+        
+        # Hide current screen; it stays cached for the next visit
         if self.current_screen:
-            self.current_screen.destroy()
+            self.current_screen.grid_remove()
+        
+        screen = self.screens.get(key)
+        if screen is not None:
+            self.screens.move_to_end(key)
+            if hasattr(screen, "refresh"):
+                screen.refresh()
+        else:
+            screen = self._create_screen(screen_name, **kwargs)
+            self.screens[key] = screen
+            # Evict the least recently shown screens
+            while len(self.screens) > self.SCREEN_CACHE_SIZE:
+                _, evicted = self.screens.popitem(last=False)
+                evicted.destroy()
         
-        # Create new screen
+        # Show new screen
+        self.current_screen = screen
+        self.current_screen.grid(row=0, column=0, sticky="nsew")
+    
+    def _create_screen(self, screen_name: str, **kwargs):
+        """Build the widget tree for a screen"""
         if screen_name == "list":
-            self.current_screen = ServerListScreen(
+            from dst_server_manager.screens.server_list import ServerListScreen
+            return ServerListScreen(
                 self.root,
                 self.manager,
                 self.switch_screen
             )
-        elif screen_name == "create":
-            self.current_screen = ServerCreateScreen(
+        if screen_name == "create":
+            from dst_server_manager.screens.server_create import ServerCreateScreen
+            return ServerCreateScreen(
                 self.root,
                 self.manager,
                 self.switch_screen
             )
-        elif screen_name == "config":
-            if "server_name" not in kwargs:
-                raise ValueError("server_name required for config screen")
-            self.current_screen = ServerConfigScreen(
-                self.root,
-                self.manager,
-                self.switch_screen,
-                kwargs["server_name"]
-            )
-        else:
-            raise ValueError(f"Unknown screen: {screen_name}")
-        
-        # Show new screen
-        self.current_screen.grid(row=0, column=0, sticky="nsew")
+        from dst_server_manager.screens.server_config import ServerConfigScreen
+        return ServerConfigScreen(
+            self.root,
+            self.manager,
+            self.switch_screen,
+            kwargs["server_name"]
+        )
     
     def run(self):
         """Start the GUI"""
@@ -1,33 +1,150 @@
 import os
+import re
+import copy
 import json
+import time
 import logging
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-import requests
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from ._logging import configure_logging
+from ._http import SESSION, TIMEOUT
+from ._io import write_if_changed, ensure_dir, forget_dirs
+from ._lua import lua_value
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, install with the "fast" extra
+    orjson = None
 
 # Set up logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('dst_server_manager.log'),
-        logging.StreamHandler()
-    ]
-)
+configure_logging()
 logger = logging.getLogger('ModManager')
 
+_WORKSHOP_TITLE_RE = re.compile(r'<div class="workshopItemTitle">([^<]+)</div>')
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize obj as indented JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@functools.lru_cache(maxsize=8)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file; the stat fields in the key invalidate stale entries"""
+    return _json_loads(Path(path).read_bytes())
+
+# Fixed preambles of the generated mod files; per-mod lines are appended after them
+_MODS_SETUP_HEADER = (
+    "--There are two functions that will install mods, ServerModSetup and ServerModCollectionSetup.",
+    "--Put the calls to the functions in this file and they will be executed on boot.",
+    "",
+    "--ServerModSetup takes a string of a specific mod's Workshop id.",
+    "--It will download and install the mod to your mod directory on boot.",
+    "    --The Workshop id can be found at the end of the url to the mod's Workshop page.",
+    "    --Example: http://steamcommunity.com/sharedfiles/filedetails/?id=350811795",
+    "    --ServerModSetup(\"350811795\")",
+    "",
+    "--ServerModCollectionSetup takes a string of a specific mod's Workshop id.",
+    "--It will download all the mods in the collection and install them to the mod directory on boot.",
+    "    --The Workshop id can be found at the end of the url to the collection's Workshop page.",
+    "    --Example: http://steamcommunity.com/sharedfiles/filedetails/?id=379114180",
+    "    --ServerModCollectionSetup(\"379114180\")",
+    "",
+    "-- Mods configured for this server:",
+    ""
+)
+
+_MODSETTINGS_HEADER = (
+    "-- Use the \"ForceEnableMod\" function when developing a mod. This will cause the",
+    "-- game to load the mod every time no matter what, saving you the trouble of",
+    "-- re-enabling it from the main menu.",
+    "--",
+    "-- Note! You shout NOT do this for normal mod loading. Please use the Mods menu",
+    "-- from the main screen instead.",
+    "",
+    "--ForceEnableMod(\"kioskmode_dst\")",
+    "",
+    "-- Use \"EnableModDebugPrint()\" to show extra information during startup.",
+    "",
+    "EnableModDebugPrint()",
+    "",
+    "-- Use \"EnableModError()\" to make the game more strict and crash on bad mod practices.",
+    "",
+    "--EnableModError()",
+    "",
+    "-- Use \"DisableModDisabling()\" to make the game stop disabling your mods when the game crashes",
+    "",
+    "--DisableModDisabling()",
+    "",
+    "-- Use \"DisableLocalModWarning()\" to make the game stop warning you when enabling local mods.",
+    "",
+    "--DisableLocalModWarning()",
+    "",
+    "-- Mods configured for this server:",
+    "-- Note: These mods will be force-enabled on server startup",
+    "",
+    "-- Force enable configured mods"
+)
+
 class ModManager:
+    # Cached Workshop info older than this is refetched, falling back to it if Steam is unreachable
+    MOD_INFO_TTL = 7 * 24 * 3600
+
     def __init__(self, base_path: Optional[str] = None):
         self.base_path = base_path or os.path.expanduser("~\\Documents\\Klei\\DoNotStarveTogether")
         self.mod_settings_path = Path(self.base_path) / "mod_config.json"
+        self.mod_info_cache_path = Path(self.base_path) / ".mod_info_cache.json"
+        # Directories this manager has already created or confirmed
+        self._mkdir_cache: Set[str] = set()
+        # Workshop info keyed by mod ID as (fetched timestamp, info), persisted across runs
+        self._mod_info_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._mod_info_lock = threading.Lock()
+        self._load_mod_info_cache()
         self.load_mod_settings()
 
+    def _load_mod_info_cache(self) -> None:
+        """Prefill the Workshop info cache from disk"""
+        try:
+            entries = _json_loads(self.mod_info_cache_path.read_bytes())
+            self._mod_info_cache = {
+                mod_id: (entry['fetched'], entry['info']) for mod_id, entry in entries.items()
+            }
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable mod info cache: {str(e)}")
+
+    def _store_mod_infos(self, mod_infos: Dict[str, Dict]) -> None:
+        """Cache successful Workshop lookups in memory and on disk"""
+        with self._mod_info_lock:
+            now = time.time()
+            self._mod_info_cache.update({mod_id: (now, info) for mod_id, info in mod_infos.items()})
+            entries = {
+                cached_id: {'fetched': fetched, 'info': info}
+                for cached_id, (fetched, info) in self._mod_info_cache.items()
+            }
+            try:
+                write_if_changed(self.mod_info_cache_path, _json_dumps(entries))
+            except Exception as e:
+                logger.warning(f"Failed to save mod info cache: {str(e)}")
+
     def load_mod_settings(self) -> None:
         """Load mod settings from JSON file or create default if not exists"""
         try:
             if self.mod_settings_path.exists():
-                with open(self.mod_settings_path, 'r') as f:
-                    loaded_settings = json.load(f)
+                # Reuse the parsed file while it is unchanged on disk; copy before mutating
+                stat = self.mod_settings_path.stat()
+                loaded_settings = copy.deepcopy(
+                    _load_json_cached(str(self.mod_settings_path), stat.st_mtime_ns, stat.st_size))
                     
                 # Handle migration from old format
                 if 'installed_mods' in loaded_settings:
@@ -37,14 +154,17 @@ class ModManager:
                     # Get list of servers
                     server_list = []
                     if os.path.exists(self.base_path):
-                        server_list = [d for d in os.listdir(self.base_path) 
-                                     if os.path.isdir(os.path.join(self.base_path, d))]
+                        # scandir reports the entry type with the listing, no stat per entry
+                        with os.scandir(self.base_path) as entries:
+                            server_list = [entry.name for entry in entries if entry.is_dir()]
                     
-                    # Copy mods to each server
+                    # Copy mods to each server; entries are copied one level deep and share
+                    # their configuration_options dicts, which are replaced rather than mutated
+                    installed_mods = loaded_settings['installed_mods']
                     for server in server_list:
-                        self.mod_settings['servers'][server] = {}
-                        for mod_id, mod_config in loaded_settings['installed_mods'].items():
-                            self.mod_settings['servers'][server][mod_id] = mod_config.copy()
+                        self.mod_settings['servers'][server] = {
+                            mod_id: dict(mod_config) for mod_id, mod_config in installed_mods.items()
+                        }
                     
                     self.save_mod_settings()
                     logger.info("Mod settings migration complete")
@@ -58,50 +178,71 @@ class ModManager:
             self.mod_settings = {'servers': {}}
             self.save_mod_settings()
 
+    def _ensure_dir(self, path) -> None:
+        """Create a directory once per manager instead of on every write"""
+        ensure_dir(path, self._mkdir_cache)
+
+    def forget_dirs(self, path) -> None:
+        """Forget created directories under path after it was deleted"""
+        forget_dirs(path, self._mkdir_cache)
+
     def save_mod_settings(self) -> None:
         """Save mod settings to JSON file"""
-        os.makedirs(os.path.dirname(self.mod_settings_path), exist_ok=True)
-        with open(self.mod_settings_path, 'w') as f:
-            json.dump(self.mod_settings, f, indent=2)
+        self._ensure_dir(os.path.dirname(self.mod_settings_path))
+        with open(self.mod_settings_path, 'wb') as f:
+            f.write(_json_dumps(self.mod_settings))
+        _load_json_cached.cache_clear()
 
-    def add_mod(self, server_name: str, mod_id: Union[str, int], config: Optional[Dict] = None) -> None:
-        """Add a mod to a server's configuration"""
+    def add_mod(self, server_name: str, mod_id: Union[str, int], config: Optional[Dict] = None,
+                mod_info: Optional[Dict] = None) -> None:
+        """
+        Add a mod to a server's configuration
+        
+        Args:
+            mod_info: Optional name/version for the mod; fetched from the Workshop if omitted
+        """
+        mod_id = str(mod_id)
+        self.add_mods(server_name, {mod_id: config},
+                      None if mod_info is None else {mod_id: mod_info})
+
+    def add_mods(self, server_name: str, mods: Dict[Union[str, int], Optional[Dict]],
+                 mod_infos: Optional[Dict[str, Dict]] = None) -> None:
+        """
+        Add several mods to a server, saving settings and regenerating its mod files once
+        
+        Args:
+            mods: Mod ID -> configuration options
+            mod_infos: Optional mod ID -> name/version; missing ones are fetched in one batch
+        """
+        mods = {str(mod_id): config for mod_id, config in mods.items()}
         try:
-            logger.info(f"Adding mod {mod_id} to server {server_name}")
-            mod_id = str(mod_id)
+            logger.info(f"Adding mods {', '.join(mods)} to server {server_name}")
             
             # Initialize server mods if not exists
-            if server_name not in self.mod_settings['servers']:
-                self.mod_settings['servers'][server_name] = {}
+            server_mods = self.mod_settings['servers'].setdefault(server_name, {})
             
-            # Add or update mod configuration
-            mod_info = self._fetch_mod_info(mod_id)
-            self.mod_settings['servers'][server_name][mod_id] = {
-                'name': mod_info.get('name', 'Unknown Mod'),
-                'version': mod_info.get('version', '1.0'),
-                'enabled': True,
-                'configuration_options': config or {}
-            }
+            # Add or update mod configurations
+            mod_infos = dict(mod_infos or {})
+            missing = [mod_id for mod_id in mods if mod_id not in mod_infos]
+            if missing:
+                mod_infos.update(self._fetch_mod_infos(missing))
+            for mod_id, config in mods.items():
+                mod_info = mod_infos[mod_id]
+                server_mods[mod_id] = {
+                    'name': mod_info.get('name', 'Unknown Mod'),
+                    'version': mod_info.get('version', '1.0'),
+                    'enabled': True,
+                    'configuration_options': config or {}
+                }
             self.save_mod_settings()
-            logger.debug(f"Saved mod settings for {mod_id} in server {server_name}")
+            logger.debug(f"Saved mod settings for server {server_name}")
 
-            # Create server directories if they don't exist
-            server_path = Path(self.base_path) / server_name
-            master_path = server_path / "Master"
-            caves_path = server_path / "Caves"
-            mods_path = server_path / "server_files" / "mods"
-            
-            logger.debug(f"Creating directories: {master_path}, {caves_path}, {mods_path}")
-            os.makedirs(master_path, exist_ok=True)
-            os.makedirs(caves_path, exist_ok=True)
-            os.makedirs(mods_path, exist_ok=True)
-
-            # Update mod configurations
+            # Update mod configurations, creating the server directories if needed
             self._update_server_modsetup(server_name)
             
-            logger.info(f"Successfully added mod {mod_id} to server {server_name}")
+            logger.info(f"Successfully added mods {', '.join(mods)} to server {server_name}")
         except Exception as e:
-            logger.error(f"Error adding mod {mod_id} to server {server_name}: {str(e)}", exc_info=True)
+            logger.error(f"Error adding mods {', '.join(mods)} to server {server_name}: {str(e)}", exc_info=True)
             raise
 
     def remove_mod(self, server_name: str, mod_id: Union[str, int]) -> None:
@@ -124,6 +265,10 @@ class ModManager:
             logger.error(f"Error removing mod {mod_id} from server {server_name}: {str(e)}", exc_info=True)
             raise
 
+    def get_server_mod_ids(self, server_name: str) -> List[str]:
+        """Get the IDs of the mods configured for a server"""
+        return list(self.mod_settings['servers'].get(server_name, ()))
+
     def get_server_mods(self, server_name: str) -> Dict[str, Dict]:
         """Get all mods configured for a server"""
         try:
@@ -159,52 +304,96 @@ class ModManager:
             logger.error(f"Error updating mod config: {str(e)}", exc_info=True)
             raise
 
-    def _fetch_mod_info(self, mod_id: str) -> Dict:
-        """Fetch mod information from Steam Workshop"""
-        try:
-            # Steam Workshop API requires POST for GetPublishedFileDetails
-            response = requests.post(
-                "https://api.steampowered.com/ISteamRemoteStorage/GetPublishedFileDetails/v1/",
-                data={
-                    "itemcount": "1",
-                    "publishedfileids[0]": mod_id
-                }
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if 'response' in data and 'publishedfiledetails' in data['response']:
-                    mod_details = data['response']['publishedfiledetails'][0]
+    def _query_published_file_details(self, mod_ids: List[str]) -> Dict[str, Dict]:
+        """Look up several mods with one GetPublishedFileDetails request"""
+        # Steam Workshop API requires POST for GetPublishedFileDetails
+        data = {"itemcount": str(len(mod_ids))}
+        data.update({f"publishedfileids[{i}]": mod_id for i, mod_id in enumerate(mod_ids)})
+        response = SESSION.post(
+            "https://api.steampowered.com/ISteamRemoteStorage/GetPublishedFileDetails/v1/",
+            data=data,
+            timeout=TIMEOUT
+        )
+        
+        found = {}
+        if response.status_code == 200:
+            data = response.json()
+            if 'response' in data and 'publishedfiledetails' in data['response']:
+                for mod_details in data['response']['publishedfiledetails']:
                     if mod_details.get('result', 0) == 1:  # Success
-                        return {
+                        mod_id = str(mod_details.get('publishedfileid', ''))
+                        found[mod_id] = {
                             'name': mod_details.get('title', f"Mod {mod_id}"),
                             'version': '1.0',
                             'description': mod_details.get('description', '')
                         }
-            
-            # Fallback to web scraping if API fails
-            workshop_url = f"https://steamcommunity.com/sharedfiles/filedetails/?id={mod_id}"
-            response = requests.get(workshop_url)
-            if response.status_code == 200:
-                # Look for the mod title in the page content
-                content = response.text
-                import re
-                title_match = re.search(r'<div class="workshopItemTitle">([^<]+)</div>', content)
-                if title_match:
-                    return {
-                        'name': title_match.group(1).strip(),
-                        'version': '1.0'
-                    }
-            
-            # If all attempts fail, return default
-            return {
-                'name': f"Mod {mod_id}",
-                'version': '1.0'
-            }
-            
+        return found
+
+    def _scrape_mod_info(self, mod_id: str) -> Optional[Dict]:
+        """Read a mod's title from its Workshop page"""
+        workshop_url = f"https://steamcommunity.com/sharedfiles/filedetails/?id={mod_id}"
+        response = SESSION.get(workshop_url, timeout=TIMEOUT)
+        if response.status_code == 200:
+            # Look for the mod title in the page content
+            title_match = _WORKSHOP_TITLE_RE.search(response.text)
+            if title_match:
+                return {
+                    'name': title_match.group(1).strip(),
+                    'version': '1.0'
+                }
+        return None
+
+    def _fetch_mod_info(self, mod_id: str) -> Dict:
+        """Fetch mod information from Steam Workshop"""
+        return self._fetch_mod_infos([mod_id])[str(mod_id)]
+
+    def _fetch_mod_infos(self, mod_ids: List[str]) -> Dict[str, Dict]:
+        """Fetch Workshop info for several mods with one batched API request"""
+        mod_ids = list(dict.fromkeys(str(mod_id) for mod_id in mod_ids))
+        now = time.time()
+        results = {}
+        pending = []
+        for mod_id in mod_ids:
+            cached = self._mod_info_cache.get(mod_id)
+            if cached is not None and now - cached[0] < self.MOD_INFO_TTL:
+                results[mod_id] = cached[1]
+            else:
+                pending.append(mod_id)
+        if not pending:
+            return results
+        
+        fetched = {}
+        try:
+            fetched = self._query_published_file_details(pending)
+        except Exception as e:
+            logger.error(f"Failed to fetch mod info: {e}")
+        
+        # Fallback to web scraping for mods the API didn't resolve
+        missing = [mod_id for mod_id in pending if mod_id not in fetched]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(len(missing), 16)) as executor:
+                for mod_id, mod_info in zip(missing, executor.map(self._try_scrape_mod_info, missing)):
+                    if mod_info is not None:
+                        fetched[mod_id] = mod_info
+        
+        if fetched:
+            self._store_mod_infos(fetched)
+        for mod_id in pending:
+            if mod_id in fetched:
+                results[mod_id] = fetched[mod_id]
+            else:
+                # An expired entry is still better than the placeholder if Steam can't be reached
+                cached = self._mod_info_cache.get(mod_id)
+                results[mod_id] = cached[1] if cached is not None else {'name': f"Mod {mod_id}", 'version': '1.0'}
+        return results
+
+    def _try_scrape_mod_info(self, mod_id: str) -> Optional[Dict]:
+        """_scrape_mod_info that logs failures instead of raising, for use in the pool"""
+        try:
+            return self._scrape_mod_info(mod_id)
         except Exception as e:
             logger.error(f"Failed to fetch mod info: {e}")
-            return {'name': f"Mod {mod_id}", 'version': '1.0'}
+            return None
 
     def _update_server_modsetup(self, server_name: str) -> None:
         """Update dedicated_server_mods_setup.lua and modsettings.lua"""
@@ -216,114 +405,41 @@ class ModManager:
             mods_path = server_path / "server_files" / "mods"
             
             # Create directories if they don't exist
-            os.makedirs(master_path, exist_ok=True)
-            os.makedirs(caves_path, exist_ok=True)
-            os.makedirs(mods_path, exist_ok=True)
+            self._ensure_dir(master_path)
+            self._ensure_dir(caves_path)
+            self._ensure_dir(mods_path)
             
             # Get server's mods
             server_mods = self.mod_settings['servers'].get(server_name, {})
             
-            # Create modoverrides.lua content
-            modoverrides_content = "return {\n"
+            # Build modoverrides.lua, setup and settings lines in one pass over the enabled mods
+            overrides = ["return {"]
+            setup_content = list(_MODS_SETUP_HEADER)
+            settings_content = list(_MODSETTINGS_HEADER)
             for mod_id, mod_config in server_mods.items():
-                if mod_config.get('enabled', True):
-                    modoverrides_content += f'  ["workshop-{mod_id}"] = {{ configuration_options = {{\n'
-                    for key, value in mod_config.get('configuration_options', {}).items():
-                        if isinstance(value, bool):
-                            value = str(value).lower()
-                        elif isinstance(value, (int, float)):
-                            value = str(value)
-                        else:
-                            value = f'"{value}"'
-                        modoverrides_content += f'    {key} = {value},\n'
-                    modoverrides_content += "  }, enabled = true },\n"
-            modoverrides_content += "}\n"
+                if not mod_config.get('enabled', True):
+                    continue
+                overrides.append(f'  ["workshop-{mod_id}"] = {{ configuration_options = {{')
+                overrides.extend([f'    {key} = {lua_value(value)},'
+                                  for key, value in mod_config.get('configuration_options', {}).items()])
+                overrides.append("  }, enabled = true },")
+                setup_content.append(f'ServerModSetup("{mod_id}") -- {mod_config.get("name", "")}')
+                settings_content.append(f'ForceEnableMod("workshop-{mod_id}")')
+            overrides.append("}")
+            modoverrides_content = ("\n".join(overrides) + "\n").encode('utf-8')
             
             # Write modoverrides.lua to both Master and Caves directories
-            for path in [master_path, caves_path]:
-                modoverrides_path = path / "modoverrides.lua"
-                with open(modoverrides_path, 'w', newline='\n') as f:
-                    f.write(modoverrides_content)
-                logger.debug(f"Created modoverrides.lua in {path}")
-            
-            # Get enabled mods
-            enabled_mods = [
-                mod_id for mod_id, config in server_mods.items()
-                if config.get('enabled', True)
-            ]
+            for path in (master_path, caves_path):
+                if write_if_changed(path / "modoverrides.lua", modoverrides_content):
+                    logger.debug(f"Created modoverrides.lua in {path}")
             
             # Update dedicated_server_mods_setup.lua
             setup_path = mods_path / "dedicated_server_mods_setup.lua"
-            setup_content = [
-                "--There are two functions that will install mods, ServerModSetup and ServerModCollectionSetup.",
-                "--Put the calls to the functions in this file and they will be executed on boot.",
-                "",
-                "--ServerModSetup takes a string of a specific mod's Workshop id.",
-                "--It will download and install the mod to your mod directory on boot.",
-                "    --The Workshop id can be found at the end of the url to the mod's Workshop page.",
-                "    --Example: http://steamcommunity.com/sharedfiles/filedetails/?id=350811795",
-                "    --ServerModSetup(\"350811795\")",
-                "",
-                "--ServerModCollectionSetup takes a string of a specific mod's Workshop id.",
-                "--It will download all the mods in the collection and install them to the mod directory on boot.",
-                "    --The Workshop id can be found at the end of the url to the collection's Workshop page.",
-                "    --Example: http://steamcommunity.com/sharedfiles/filedetails/?id=379114180",
-                "    --ServerModCollectionSetup(\"379114180\")",
-                "",
-                "-- Mods configured for this server:",
-                ""
-            ]
-            
-            # Add mod setup calls
-            for mod_id in enabled_mods:
-                mod_name = server_mods[mod_id]["name"]
-                setup_content.append(f'ServerModSetup("{mod_id}") -- {mod_name}')
-            
-            # Write setup file
-            with open(setup_path, 'w', newline='\n') as f:
-                f.write('\n'.join(setup_content))
+            write_if_changed(setup_path, '\n'.join(setup_content).encode('utf-8'))
             
             # Update modsettings.lua
             settings_path = mods_path / "modsettings.lua"
-            settings_content = [
-                "-- Use the \"ForceEnableMod\" function when developing a mod. This will cause the",
-                "-- game to load the mod every time no matter what, saving you the trouble of",
-                "-- re-enabling it from the main menu.",
-                "--",
-                "-- Note! You shout NOT do this for normal mod loading. Please use the Mods menu",
-                "-- from the main screen instead.",
-                "",
-                "--ForceEnableMod(\"kioskmode_dst\")",
-                "",
-                "-- Use \"EnableModDebugPrint()\" to show extra information during startup.",
-                "",
-                "EnableModDebugPrint()",
-                "",
-                "-- Use \"EnableModError()\" to make the game more strict and crash on bad mod practices.",
-                "",
-                "--EnableModError()",
-                "",
-                "-- Use \"DisableModDisabling()\" to make the game stop disabling your mods when the game crashes",
-                "",
-                "--DisableModDisabling()",
-                "",
-                "-- Use \"DisableLocalModWarning()\" to make the game stop warning you when enabling local mods.",
-                "",
-                "--DisableLocalModWarning()",
-                "",
-                "-- Mods configured for this server:",
-                "-- Note: These mods will be force-enabled on server startup",
-                "",
-                "-- Force enable configured mods"
-            ]
-            
-            # Add force enable for each mod
-            for mod_id in enabled_mods:
-                settings_content.append(f'ForceEnableMod("workshop-{mod_id}")')
-            
-            # Write settings file
-            with open(settings_path, 'w', newline='\n') as f:
-                f.write('\n'.join(settings_content))
+            write_if_changed(settings_path, '\n'.join(settings_content).encode('utf-8'))
             
             logger.info(f"Successfully updated mod setup for server {server_name}")
         except Exception as e:
@@ -1,5 +1,17 @@
-from .server_list import ServerListScreen
-from .server_create import ServerCreateScreen
-from .server_config import ServerConfigScreen
+import importlib
+
+# Screens are loaded on first access so only the screens actually shown are imported
+_SCREENS = {
+    'ServerListScreen': '.server_list',
+    'ServerCreateScreen': '.server_create',
+    'ServerConfigScreen': '.server_config',
+}
 
 __all__ = ['ServerListScreen', 'ServerCreateScreen', 'ServerConfigScreen']
+
+def __getattr__(name):
+    if name in _SCREENS:
+        value = getattr(importlib.import_module(_SCREENS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
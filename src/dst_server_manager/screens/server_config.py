@@ -4,6 +4,7 @@ from typing import Callable
 from ..components.settings_tab import SettingsTab
 from ..components.mods_tab import ModsTab
 from ..components.save_card import SaveCard
+from ..components.import_dialog import ImportDialog
 from ..server_manager import ServerManager
 
 class ServerConfigScreen(ctk.CTkFrame):
@@ -57,26 +58,28 @@ class ServerConfigScreen(ctk.CTkFrame):
         )
         self.mods_tab.pack(fill="both", expand=True, padx=10, pady=10)
     
+    def refresh(self):
+        """Reload settings and mods when the cached screen is shown again"""
+        self.settings_tab.load_config()
+        self.mods_tab.refresh_mods()
+    
     def show_import_dialog(self):
         """Show dialog to import save from another server"""
         try:
-            # Get list of servers with saves
-            servers = self.manager.world_manager.list_servers_with_saves()
+            # Get list of servers with saves; the dialog reads mods for the chosen one
+            servers = self.manager.world_manager.list_servers_with_saves(include_mods=False)
             if not servers:
                 messagebox.showinfo("Import Save", "No servers with saves found")
                 return
             
             def import_callback(source: str, target: str):
-                try:
-                    self.manager.world_manager.import_save(source, target)
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to import save: {str(e)}")
+                # Runs on the dialog's worker thread; errors are reported by the dialog
+                self.manager.world_manager.import_save(source, target)
             
             # Get root window
             root = self.winfo_toplevel()
             
             # Create dialog
-            from ..components.import_dialog import ImportDialog
             dialog = ImportDialog(
                 root, 
                 servers, 
@@ -1,58 +1,82 @@
 import customtkinter as ctk
 from tkinter import messagebox
 import os
+import re
 import shutil
-from pathlib import Path
-from typing import Dict, Any, Callable
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Mapping, Tuple
 from threading import Thread
 from queue import Queue
 from ..server_manager import ServerManager
 
+# Server names become directory names: ASCII letters, digits and underscores only
+_NAME_RE = re.compile(r'\A\w+\Z', re.ASCII)
+
+@dataclass(frozen=True)
 class ServerTemplate:
     """Template data for server creation"""
-    TEMPLATES = [
-        {
-            "name": "Survival Server",
-            "description": "Classic survival experience",
-            "preset": "default",
-            "settings": {
-                "game_mode": "survival",
-                "max_players": 6,
-                "pvp": False,
-                "pause_when_empty": True
-            }
-        },
-        {
-            "name": "Endless Server",
-            "description": "Long-term gameplay with abundant resources",
-            "preset": "endless",
-            "settings": {
-                "game_mode": "endless",
-                "max_players": 8,
-                "pvp": False,
-                "pause_when_empty": True
-            }
-        },
-        {
-            "name": "PvP Server",
-            "description": "Competitive survival with PvP enabled",
-            "preset": "wilderness",
-            "settings": {
-                "game_mode": "survival",
-                "max_players": 10,
-                "pvp": True,
-                "pause_when_empty": False
-            }
-        }
-    ]
+    __slots__ = ("name", "description", "preset", "settings")
+    name: str
+    description: str
+    preset: str
+    settings: Mapping[str, Any]
+
+TEMPLATES: Tuple[ServerTemplate, ...] = (
+    ServerTemplate(
+        name="Survival Server",
+        description="Classic survival experience",
+        preset="default",
+        settings=MappingProxyType({
+            "game_mode": "survival",
+            "max_players": 6,
+            "pvp": False,
+            "pause_when_empty": True
+        })
+    ),
+    ServerTemplate(
+        name="Endless Server",
+        description="Long-term gameplay with abundant resources",
+        preset="endless",
+        settings=MappingProxyType({
+            "game_mode": "endless",
+            "max_players": 8,
+            "pvp": False,
+            "pause_when_empty": True
+        })
+    ),
+    ServerTemplate(
+        name="PvP Server",
+        description="Competitive survival with PvP enabled",
+        preset="wilderness",
+        settings=MappingProxyType({
+            "game_mode": "survival",
+            "max_players": 10,
+            "pvp": True,
+            "pause_when_empty": False
+        })
+    ),
+)
 
 class ServerCreateScreen(ctk.CTkFrame):
     """Screen for creating a new server"""
+    # Lines kept in the installation log textbox
+    LOG_MAX_LINES = 1000
+    
     def __init__(self, parent, manager: ServerManager, switch_screen: Callable):
         super().__init__(parent)
         self.manager = manager
         self.switch_screen = switch_screen
         
+        # Create dialog, built on first use and reused; see _show_create_dialog
+        self._create_dialog = None
+        self._creating = False
+        self._log_buf = []
+        self._last_step = None
+        self._latest_progress = None
+        # Events posted by the creation worker thread, drained on the Tk thread by _pump
+        self._events = Queue()
+        
         self._create_header()
         self._create_templates_section()
     
@@ -72,50 +96,63 @@ class ServerCreateScreen(ctk.CTkFrame):
         templates_frame = ctk.CTkFrame(self)
         templates_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
-        for template in ServerTemplate.TEMPLATES:
+        for template in TEMPLATES:
             self._create_template_card(templates_frame, template)
     
-    def _create_template_card(self, parent: ctk.CTkFrame, template: Dict[str, Any]):
+    def _create_template_card(self, parent: ctk.CTkFrame, template: ServerTemplate):
         """Create a card for a server template"""
         card = ctk.CTkFrame(parent)
         card.pack(fill="x", padx=10, pady=5)
         
-        ctk.CTkLabel(card, text=template["name"],
+        ctk.CTkLabel(card, text=template.name,
                     font=("Arial", 16, "bold")).pack(padx=10, pady=5)
-        ctk.CTkLabel(card, text=template["description"]).pack(padx=10)
+        ctk.CTkLabel(card, text=template.description).pack(padx=10)
         
         ctk.CTkButton(card, text="Use Template",
                      command=lambda: self._show_create_dialog(template)).pack(padx=10, pady=10)
     
-    def _show_create_dialog(self, template: Dict[str, Any]):
+    def _show_create_dialog(self, template: ServerTemplate):
         """Show dialog for entering server details"""
+        if self._create_dialog is None:
+            self._build_create_dialog()
+        elif self._creating:
+            # A server is still being created; just bring its progress back up
+            self._create_dialog.deiconify()
+            return
+        self._reset_create_dialog(template)
+        self._create_dialog.deiconify()
+        self._create_dialog.lift()
+    
+    def _build_create_dialog(self):
+        """Build the create dialog once; it is hidden and reused afterwards"""
         dialog = ctk.CTkToplevel(self)
         dialog.title("Create Server")
         dialog.geometry("600x700")
         dialog.attributes('-topmost', True)
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
+        self._create_dialog = dialog
         
         # Server name input
         name_frame = ctk.CTkFrame(dialog)
         name_frame.pack(fill="x", padx=20, pady=10)
         ctk.CTkLabel(name_frame, text="Server Name:").pack(side="left", padx=5)
-        name_entry = ctk.CTkEntry(name_frame)
-        name_entry.pack(side="right", expand=True, fill="x", padx=5)
+        self._name_entry = ctk.CTkEntry(name_frame)
+        self._name_entry.pack(side="right", expand=True, fill="x", padx=5)
         
         # Cluster token input
         token_frame = ctk.CTkFrame(dialog)
         token_frame.pack(fill="x", padx=20, pady=10)
         ctk.CTkLabel(token_frame, text="Cluster Token:").pack(side="left", padx=5)
-        token_entry = ctk.CTkEntry(token_frame)
-        token_entry.pack(side="right", expand=True, fill="x", padx=5)
+        self._token_entry = ctk.CTkEntry(token_frame)
+        self._token_entry.pack(side="right", expand=True, fill="x", padx=5)
         
         # Progress section
         progress_frame = ctk.CTkFrame(dialog)
         progress_frame.pack(fill="x", padx=20, pady=10)
-        progress_label = ctk.CTkLabel(progress_frame, text="")
-        progress_label.pack(pady=5)
-        progress_bar = ctk.CTkProgressBar(progress_frame)
-        progress_bar.pack(fill="x", pady=5)
-        progress_bar.set(0)
+        self._progress_label = ctk.CTkLabel(progress_frame, text="")
+        self._progress_label.pack(pady=5)
+        self._progress_bar = ctk.CTkProgressBar(progress_frame)
+        self._progress_bar.pack(fill="x", pady=5)
         
         # Log viewer
         log_frame = ctk.CTkFrame(dialog)
@@ -123,80 +160,130 @@ class ServerCreateScreen(ctk.CTkFrame):
         log_label = ctk.CTkLabel(log_frame, text="Installation Log:")
         log_label.pack(pady=5)
         
-        log_text = ctk.CTkTextbox(log_frame, height=300)
-        log_text.pack(fill="both", expand=True, pady=5)
-        log_text.configure(state="disabled")
+        self._log_text = ctk.CTkTextbox(log_frame, height=300)
+        self._log_text.pack(fill="both", expand=True, pady=5)
         
-        def add_log(message: str):
-            log_text.configure(state="normal")
-            log_text.insert("end", message + "\n")
-            log_text.see("end")
-            log_text.configure(state="disabled")
-            dialog.update()
-        
-        def update_progress(step: str, progress: float):
-            progress_label.configure(text=step)
-            progress_bar.set(progress)
-            add_log(step)
-            dialog.update()
-        
-        def create_server():
-            server_name = name_entry.get().strip()
-            cluster_token = token_entry.get().strip()
-            
-            if not server_name:
-                messagebox.showwarning("Warning", "Please enter a server name")
+        # Create button
+        self._create_button = ctk.CTkButton(dialog, text="Create Server")
+        self._create_button.pack(pady=20)
+    
+    def _reset_create_dialog(self, template: ServerTemplate):
+        """Clear the dialog's fields and point it at template"""
+        for entry in (self._name_entry, self._token_entry):
+            entry.configure(state="normal")
+            entry.delete(0, "end")
+        self._progress_label.configure(text="")
+        self._progress_bar.set(0)
+        self._log_text.configure(state="normal")
+        self._log_text.delete("1.0", "end")
+        self._log_text.configure(state="disabled")
+        self._log_buf.clear()
+        self._last_step = None
+        self._latest_progress = None
+        self._create_button.configure(state="normal",
+                                      command=lambda: self._start_create(template))
+    
+    def _add_log(self, message: str):
+        # Log lines are buffered and written to the textbox once per pump tick
+        self._log_buf.append(message + "\n")
+    
+    def _flush_log(self):
+        if not self._log_buf:
+            return
+        log_text = self._log_text
+        log_text.configure(state="normal")
+        log_text.insert("end", "".join(self._log_buf))
+        self._log_buf.clear()
+        # Keep only the most recent lines
+        line_count = int(log_text.index("end-1c").split(".")[0])
+        if line_count > self.LOG_MAX_LINES:
+            log_text.delete("1.0", f"{line_count - self.LOG_MAX_LINES}.0")
+        log_text.see("end")
+        log_text.configure(state="disabled")
+    
+    def _update_progress(self, step: str, progress: float):
+        # Chunked downloads repeat the same step many times; log it once
+        if step != self._last_step:
+            self._last_step = step
+            self._add_log(step)
+        self._latest_progress = (step, progress)
+    
+    def _apply_progress(self):
+        """Show the newest progress event of this pump tick"""
+        if self._latest_progress is None:
+            return
+        step, progress = self._latest_progress
+        self._latest_progress = None
+        self._progress_label.configure(text=step)
+        self._progress_bar.set(progress)
+    
+    def _pump(self):
+        """Drain worker events on the Tk thread"""
+        if not self._create_dialog.winfo_exists():
+            return
+        while not self._events.empty():
+            kind, *payload = self._events.get_nowait()
+            if kind == "progress":
+                self._update_progress(*payload)
+            elif kind == "done":
+                self._creating = False
+                messagebox.showinfo("Success", f"Server '{payload[0]}' created!")
+                self._create_dialog.withdraw()
+                self.switch_screen("list")
                 return
-            
-            if not server_name.replace('_', '').isalnum():
-                messagebox.showwarning("Warning", "Server name can only contain letters, numbers, and underscores")
+            elif kind == "error":
+                self._creating = False
+                messagebox.showerror("Error", f"Failed to create server: {str(payload[0])}")
+                self._create_dialog.withdraw()
                 return
+        self._apply_progress()
+        self._flush_log()
+        self._create_dialog.after(50, self._pump)
+    
+    def _create_worker(self, server_name: str, cluster_token: str, settings: Dict[str, Any]):
+        """Create the server on a background thread, posting progress to the event queue"""
+        def progress_callback(message: str, progress: float):
+            self._events.put(("progress", message, progress))
+        
+        try:
+            # Create server
+            self.manager.create_server(server_name, settings, progress_callback)
             
-            # Disable inputs
-            name_entry.configure(state="disabled")
-            token_entry.configure(state="disabled")
-            create_button.configure(state="disabled")
-            
-            def progress_callback(message: str, progress: float):
-                if progress_callback.cancelled:
-                    return
-                progress_label.configure(text=message)
-                progress_bar.set(progress)
-                add_log(message)
-                dialog.update()
-            
-            progress_callback.cancelled = False
+            # Save cluster token if provided
+            if cluster_token:
+                progress_callback("Saving cluster token...", 0.95)
+                self.manager.config_manager.set_server_token(server_name, cluster_token)
             
-            try:
-                # Create server with progress tracking
-                settings = template["settings"].copy()
-                settings.update({
-                    "name": server_name,
-                    "description": template["description"],
-                    "world_preset": template["preset"]
-                })
-                
-                # Create server
-                self.manager.create_server(server_name, settings, progress_callback)
-                
-                # Save cluster token if provided
-                if cluster_token:
-                    progress_callback("Saving cluster token...", 0.95)
-                    token_path = Path(self.manager.base_path) / server_name / "cluster_token.txt"
-                    with open(token_path, 'w') as f:
-                        f.write(cluster_token)
-                
-                progress_callback("Server created successfully!", 1.0)
-                messagebox.showinfo("Success", f"Server '{server_name}' created!")
-                dialog.destroy()
-                self.switch_screen("list")
-                
-            except Exception as e:
-                progress_callback.cancelled = True
-                messagebox.showerror("Error", f"Failed to create server: {str(e)}")
-                dialog.destroy()
+            progress_callback("Server created successfully!", 1.0)
+            self._events.put(("done", server_name))
+        except Exception as e:
+            self._events.put(("error", e))
+    
+    def _start_create(self, template: ServerTemplate):
+        server_name = self._name_entry.get().strip()
+        cluster_token = self._token_entry.get().strip()
         
-        # Create button
-        create_button = ctk.CTkButton(dialog, text="Create Server",
-                                    command=create_server)
-        create_button.pack(pady=20)
+        if not server_name:
+            messagebox.showwarning("Warning", "Please enter a server name")
+            return
+        
+        if not _NAME_RE.match(server_name):
+            messagebox.showwarning("Warning", "Server name can only contain letters, numbers, and underscores")
+            return
+        
+        # Disable inputs
+        self._name_entry.configure(state="disabled")
+        self._token_entry.configure(state="disabled")
+        self._create_button.configure(state="disabled")
+        
+        settings = {
+            **template.settings,
+            "name": server_name,
+            "description": template.description,
+            "world_preset": template.preset
+        }
+        
+        # Install and configure off the Tk thread so the UI keeps running
+        self._creating = True
+        Thread(target=self._create_worker, args=(server_name, cluster_token, settings), daemon=True).start()
+        self._create_dialog.after(50, self._pump)
@@ -1,11 +1,16 @@
 import customtkinter as ctk
 from tkinter import messagebox
-from typing import Callable
+from typing import Callable, List, Optional, Tuple
 from ..components.server_card import ServerCard
 from ..server_manager import ServerManager
 
 class ServerListScreen(ctk.CTkFrame):
     """Main screen showing all servers as cards"""
+    # Interval between server status refreshes
+    REFRESH_MS = 2000
+    # Window in which on-demand refresh requests are coalesced
+    REFRESH_DEBOUNCE_MS = 200
+    
     def __init__(self, parent, manager: ServerManager, switch_screen: Callable):
         super().__init__(parent)
         self.manager = manager
@@ -14,8 +19,15 @@ class ServerListScreen(ctk.CTkFrame):
         self._create_header()
         self._create_cards_container()
         
-        # Start refresh timer
-        self.after(1000, self.refresh_servers)
+        # Recycled cards in display order, and the (server name, status key) each one shows;
+        # None marks a pooled card that is currently hidden
+        self._card_pool: List[ServerCard] = []
+        self._card_keys: List[Optional[Tuple]] = []
+        
+        # First refresh as soon as the screen is placed, then every REFRESH_MS
+        self._refresh_job = None
+        self._refresh_pending = False
+        self._schedule_refresh()
     
     def _create_header(self):
         """Create the header section with title and create button"""
@@ -33,33 +45,89 @@ class ServerListScreen(ctk.CTkFrame):
         self.cards_frame = ctk.CTkScrollableFrame(self)
         self.cards_frame.pack(fill="both", expand=True, padx=20, pady=10)
     
+    def refresh(self):
+        """Update the cards shortly and resume the timer, coalescing bursts of requests"""
+        if self._refresh_pending:
+            return
+        self._cancel_refresh()
+        self._refresh_pending = True
+        self._refresh_job = self.after(self.REFRESH_DEBOUNCE_MS, self._schedule_refresh)
+    
+    def _cancel_refresh(self):
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
+    
+    def destroy(self):
+        self._cancel_refresh()
+        super().destroy()
+    
+    def _schedule_refresh(self):
+        # Run the refresh once Tk is idle, so it never competes with pending redraws
+        self._refresh_job = self.after_idle(self.refresh_servers)
+    
     def refresh_servers(self):
-        """Refresh server cards"""
-        # Clear existing cards
-        for widget in self.cards_frame.winfo_children():
-            widget.destroy()
+        """Refresh server cards, touching only the ones whose status changed"""
+        self._refresh_pending = False
+        # Pause while another screen is shown; refresh() restarts the timer
+        if not self.winfo_manager():
+            self._refresh_job = None
+            return
         
-        # Create cards for each server
-        for server_name in self.manager.list_servers():
+        names = self.manager.list_servers()
+        for i, server_name in enumerate(names):
             status = self.manager.get_server_status(server_name)
-            
+            card_key = (server_name, self._status_key(status))
+            if i < len(self._card_pool):
+                if card_key == self._card_keys[i]:
+                    continue
+                card = self._card_pool[i]
+                if self._card_keys[i] is None:
+                    # Hidden cards are always the tail of the pool, so packing keeps the order
+                    card.pack(fill="x", padx=10, pady=5)
+                if card.server_name == server_name:
+                    card.update_status(status)
+                else:
+                    card.rebind(server_name, status)
+                self._card_keys[i] = card_key
+                continue
             card = ServerCard(
                 self.cards_frame,
                 server_name,
                 status,
-                lambda s=server_name: self.switch_screen("config", server_name=s),
-                lambda s=server_name: self.start_server(s),
-                lambda s=server_name: self.stop_server(s)
+                self.open_config,
+                self.start_server,
+                self.stop_server
             )
             card.pack(fill="x", padx=10, pady=5)
+            self._card_pool.append(card)
+            self._card_keys.append(card_key)
+        
+        # Hide, but keep, cards beyond the current server count
+        for i in range(len(names), len(self._card_pool)):
+            if self._card_keys[i] is not None:
+                self._card_pool[i].pack_forget()
+                self._card_keys[i] = None
         
         # Schedule next refresh
-        self.after(1000, self.refresh_servers)
+        self._refresh_job = self.after(self.REFRESH_MS, self._schedule_refresh)
+    
+    @staticmethod
+    def _status_key(status):
+        """What a card renders from a status; uptime only shows whole minutes"""
+        uptime = status['uptime']
+        return (status['name'], status['description'], status['game_mode'], status['max_players'],
+                status['running'], None if uptime is None else int(uptime // 60))
+    
+    def open_config(self, server_name: str):
+        """Show the config screen for a server"""
+        self.switch_screen("config", server_name=server_name)
     
     def start_server(self, server_name: str):
         """Start a server"""
         try:
             self.manager.start_server(server_name)
+            self.refresh()
             messagebox.showinfo("Success", f"Server '{server_name}' started!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start server: {str(e)}")
@@ -68,6 +136,7 @@ class ServerListScreen(ctk.CTkFrame):
         """Stop a server"""
         try:
             self.manager.stop_server(server_name)
+            self.refresh()
             messagebox.showinfo("Success", f"Server '{server_name}' stopped!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to stop server: {str(e)}")
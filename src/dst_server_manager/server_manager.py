@@ -1,34 +1,132 @@
+import codecs
+import io
+import locale
 import os
 import re
 import shutil
+import string
 import subprocess
 import threading
 import queue
 import sys
 import time
 import logging
+import weakref
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Callable
-import requests
+from ._logging import configure_logging
+from ._http import SESSION
+from ._io import write_if_changed
 from .config_manager import ConfigManager
 from .world_manager import WorldManager
 from .mod_manager import ModManager
 
 # Set up logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('dst_server_manager.log'),
-        logging.StreamHandler()
-    ]
-)
+configure_logging()
 logger = logging.getLogger('ServerManager')
 
+# SteamCMD progress lines carry the percentage as e.g. "progress: 42.17 (...)%"
+_PERCENT_RE = re.compile(r'(\d+(?:\.\d+)?)%')
+_STATE_PREFIX = "Update state"
+
+# Shard executable inside an install's bin64 directory
+_SERVER_EXE = "dontstarve_dedicated_server_nullrenderer_x64.exe"
+
+# Batch scripts written next to each server by _create_startup_script
+_START_SCRIPT = string.Template("""@echo off
+title DST Server - $name
+echo Starting Don't Starve Together server: $name
+echo ===============================================
+
+cd /D "$bin64"
+
+echo Starting Master shard...
+start "DST $name Master" /min cmd /c $exe -console -cluster $name -shard Master
+timeout /t 5
+
+echo Starting Caves shard...
+start "DST $name Caves" /min cmd /c $exe -console -cluster $name -shard Caves
+
+echo Server started! Check the opened console windows for details.
+echo To stop the server, run stop_server.bat
+pause
+""")
+
+_STOP_SCRIPT = string.Template("""@echo off
+title DST Server Stop - $name
+echo Stopping Don't Starve Together server: $name
+echo ===============================================
+
+taskkill /FI "WINDOWTITLE eq DST $name Master*" /T /F
+taskkill /FI "WINDOWTITLE eq DST $name Caves*" /T /F
+
+echo Server stopped!
+timeout /t 3
+""")
+
+_UPDATE_SCRIPT = string.Template("""@echo off
+title DST Server Update - $name
+echo Updating Don't Starve Together server: $name
+echo ===============================================
+
+echo Stopping server if running...
+call stop_server.bat
+
+echo Updating server files...
+cd /D "$steamcmd"
+steamcmd.exe +login anonymous +force_install_dir "$server_files" +app_update 343050 validate +quit
+
+echo Server updated!
+echo You can now start the server using start_server.bat
+pause
+""")
+
+_SCRIPT_TEMPLATES = (
+    ("start_server.bat", _START_SCRIPT),
+    ("stop_server.bat", _STOP_SCRIPT),
+    ("update_server.bat", _UPDATE_SCRIPT),
+)
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+    
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.CopyFileW.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.BOOL)
+    _kernel32.CopyFileW.restype = wintypes.BOOL
+    
+    def _copy_file(src: str, dst: str) -> None:
+        """Copy one file in the kernel, keeping attributes and timestamps"""
+        if not _kernel32.CopyFileW(src, dst, False):
+            raise ctypes.WinError(ctypes.get_last_error())
+else:
+    # copy2 already uses sendfile/fcopyfile here
+    _copy_file = shutil.copy2
+
+
+def _copy_tree(src: str, dst: str) -> None:
+    """Copy src into dst with _copy_file"""
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as it:
+        for entry in it:
+            target = os.path.join(dst, entry.name)
+            # DirEntry caches the type from the directory listing, so no extra stat
+            if entry.is_dir(follow_symlinks=False):
+                _copy_tree(entry.path, target)
+            else:
+                _copy_file(entry.path, target)
+
+
 class ServerManager:
     def __init__(self, base_path: Optional[str] = None):
         self.base_path = base_path or os.path.expanduser("~\\Documents\\Klei\\DoNotStarveTogether")
         self.steamcmd_path = "C:\\steamcmd"
+        self.steamcmd_exe = os.path.join(self.steamcmd_path, "steamcmd.exe")
+        # Shared install that SteamCMD updates and new servers are cloned from
+        self.dst_install_path = os.path.join(self.steamcmd_path, "steamapps", "common",
+                                             "Don't Starve Together Dedicated Server")
         
         # Initialize managers
         self.config_manager = ConfigManager(self.base_path)
@@ -36,8 +134,16 @@ class ServerManager:
         self.mod_manager = ModManager(self.base_path)
         
         # Track running servers and their ports
+        # Both are copy-on-write snapshots: writers build a new object and swap
+        # it in under _servers_lock, readers use whatever reference they get
+        # without locking. Shard watcher threads prune running_servers.
         self.running_servers: Dict[str, Dict[str, Any]] = {}
-        self.used_ports = set()
+        self.used_ports = frozenset()
+        self._servers_lock = threading.Lock()
+        
+        # Callbacks notified when a server's running state changes
+        self._status_listeners: Dict[str, List[Callable[[], Optional[Callable[[bool], None]]]]] = {}
+        self._listeners_lock = threading.Lock()
         
         # Default port ranges
         self.server_port_range = range(10999, 11099)
@@ -58,43 +164,47 @@ class ServerManager:
 
     def install_steamcmd(self, progress_callback: Optional[Callable] = None) -> None:
         """Download and install SteamCMD"""
-        if not os.path.exists(os.path.join(self.steamcmd_path, "steamcmd.exe")):
+        if not os.path.exists(self.steamcmd_exe):
             if progress_callback:
                 progress_callback("Downloading SteamCMD...", 0.1)
             
             # Download SteamCMD
             steamcmd_url = "https://steamcdn-a.akamaihd.net/client/installer/steamcmd.zip"
-            zip_path = os.path.join(self.steamcmd_path, "steamcmd.zip")
-            
-            response = requests.get(steamcmd_url, stream=True)
-            total_size = int(response.headers.get('content-length', 0))
-            block_size = 8192
-            downloaded = 0
-            
-            with open(zip_path, 'wb') as f:
-                for data in response.iter_content(block_size):
+            # The installer zip is a few MB, so keep it in memory instead of a temp file
+            buf = io.BytesIO()
+            
+            # The zip is already compressed; don't let the server gzip it again.
+            # The read timeout applies per chunk, so a stalled CDN can't hang creation.
+            with SESSION.get(steamcmd_url, stream=True, timeout=(5, 30),
+                             headers={'Accept-Encoding': 'identity'}) as response:
+                response.raise_for_status()
+                total_size = int(response.headers.get('content-length', 0))
+                block_size = 1024 * 1024
+                downloaded = 0
+                reported = 0.0
+                
+                for data in response.iter_content(chunk_size=block_size):
                     downloaded += len(data)
-                    f.write(data)
+                    buf.write(data)
                     if progress_callback and total_size:
-                        progress = 0.1 + (downloaded / total_size) * 0.4
-                        progress_callback("Downloading SteamCMD...", progress)
+                        # Report at most once per percent of the download
+                        fraction = downloaded / total_size
+                        if fraction - reported >= 0.01 or downloaded == total_size:
+                            reported = fraction
+                            progress_callback("Downloading SteamCMD...", 0.1 + fraction * 0.4)
             
             if progress_callback:
                 progress_callback("Extracting SteamCMD...", 0.5)
             
-            # Extract and cleanup
-            try:
-                shutil.unpack_archive(zip_path, self.steamcmd_path)
-            finally:
-                if os.path.exists(zip_path):
-                    os.remove(zip_path)
+            # Extract straight from the downloaded bytes
+            with zipfile.ZipFile(buf) as archive:
+                archive.extractall(self.steamcmd_path)
             
             # Run SteamCMD first time to update itself
             if progress_callback:
                 progress_callback("Initializing SteamCMD...", 0.7)
             
-            steamcmd_exe = os.path.join(self.steamcmd_path, "steamcmd.exe")
-            subprocess.run(f'"{steamcmd_exe}" +quit', 
+            subprocess.run(f'"{self.steamcmd_exe}" +quit', 
                          shell=True,
                          stdout=subprocess.PIPE, 
                          stderr=subprocess.PIPE,
@@ -110,23 +220,15 @@ class ServerManager:
             if progress_callback:
                 progress_callback("Creating directories...", 0.1)
             
-            # Create steamapps directory structure
-            steamapps_path = os.path.join(self.steamcmd_path, "steamapps")
-            dst_server_path = os.path.join(steamapps_path, "common", "Don't Starve Together Dedicated Server")
-            
-            # Ensure directories exist
-            os.makedirs(steamapps_path, exist_ok=True)
+            # Ensure the install directory (and steamapps above it) exists
+            dst_server_path = self.dst_install_path
             os.makedirs(dst_server_path, exist_ok=True)
             
             if progress_callback:
                 progress_callback("Running SteamCMD...", 0.2)
             
-            # Run SteamCMD with proper path escaping
-            steamcmd_exe = os.path.join(self.steamcmd_path, "steamcmd.exe")
-            
-            # Create command string with proper escaping
             cmd = [
-                steamcmd_exe,
+                self.steamcmd_exe,
                 "+@ShutdownOnFailedCommand", "0",
                 "+@NoPromptForPassword", "1",
                 "+force_install_dir", dst_server_path,
@@ -135,48 +237,60 @@ class ServerManager:
                 "+quit"
             ]
             
-            # Execute SteamCMD with arguments
+            # Execute SteamCMD directly; CreateProcess takes the argv list as is
             process = subprocess.Popen(
-                " ".join(f'"{arg}"' if " " in str(arg) else str(arg) for arg in cmd),
-                shell=True,
+                cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
+                bufsize=-1,
                 creationflags=subprocess.CREATE_NO_WINDOW
             )
             
             # Monitor process output
             current_phase = "Initializing"
             base_progress = 0.2
+            # (phase, whole percent) of the last progress line passed on
+            last_reported = None
+            # Read whatever the pipe has buffered and split lines ourselves;
+            # per-line readline() calls dominate the cost of this loop
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            leftover = ''
             while True:
-                line = process.stdout.readline()
-                if not line and process.poll() is not None:
-                    break
-                if line:
+                chunk = process.stdout.read1(65536)
+                if chunk:
+                    *lines, leftover = (leftover + decoder.decode(chunk)).split('\n')
+                else:
+                    # EOF: flush the last unterminated line and wait for exit
+                    lines = [leftover + decoder.decode(b'', final=True)]
+                    leftover = ''
+                    process.wait()
+                for line in lines:
+                    if not line:
+                        continue
                     line = line.strip()
                     if progress_callback:
-                        # Update phase based on output
-                        if "Downloading update" in line:
+                        # Update phase based on output; progress lines dominate, so test them first
+                        if line.startswith(_STATE_PREFIX):
+                            percentage_str = _PERCENT_RE.search(line)
+                            if percentage_str:
+                                percentage = float(percentage_str.group(1)) / 100
+                                # SteamCMD repeats lines for sub-percent changes; skip those
+                                reported = (current_phase, int(percentage * 100))
+                                if reported == last_reported:
+                                    continue
+                                last_reported = reported
+                                if current_phase == "Downloading":
+                                    progress = 0.2 + (percentage * 0.5)  # 20-70%
+                                else:  # Verifying
+                                    progress = 0.7 + (percentage * 0.2)  # 70-90%
+                                progress_callback(f"{current_phase}: {line}", progress)
+                        elif "Downloading update" in line:
                             current_phase = "Downloading"
                             progress_callback("Downloading server files...", base_progress)
                         elif "Verifying installation" in line:
                             current_phase = "Verifying"
                             base_progress = 0.7
                             progress_callback("Verifying files...", base_progress)
-                        elif "Update state" in line:
-                            try:
-                                percentage_str = re.search(r'(\d+(?:\.\d+)?)%', line)
-                                if percentage_str:
-                                    percentage = float(percentage_str.group(1)) / 100
-                                    if current_phase == "Downloading":
-                                        progress = 0.2 + (percentage * 0.5)  # 20-70%
-                                    else:  # Verifying
-                                        progress = 0.7 + (percentage * 0.2)  # 70-90%
-                                    progress_callback(f"{current_phase}: {line}", progress)
-                            except:
-                                progress_callback(line, base_progress)
                         elif "Success!" in line:
                             progress_callback("Download complete!", 0.9)
                         elif "error" in line.lower():
@@ -186,16 +300,18 @@ class ServerManager:
                             # Show other important messages
                             progress_callback(line, base_progress)
             
+                if not chunk:
+                    break
+            
             if process.returncode != 0:
-                error = process.stderr.read()
+                error = process.stderr.read().decode('utf-8', errors='replace')
                 raise subprocess.CalledProcessError(process.returncode, cmd, stderr=error)
             
             if progress_callback:
                 progress_callback("Verifying installation...", 0.9)
             
             # Check if server files exist after installation
-            server_exe = os.path.join(dst_server_path, "bin64", 
-                                    "dontstarve_dedicated_server_nullrenderer_x64.exe")
+            server_exe = os.path.join(dst_server_path, "bin64", _SERVER_EXE)
             if not os.path.exists(server_exe):
                 raise RuntimeError(f"Server executable not found at {server_exe}")
             
@@ -214,14 +330,9 @@ class ServerManager:
             if progress_callback:
                 progress_callback("Creating server directories...", 0.1)
             
-            # Create server directory structure
+            # The Master and Caves directories are created by create_server_config
             server_path = Path(self.base_path) / server_name
             
-            # Create main directories
-            os.makedirs(server_path, exist_ok=True)
-            os.makedirs(server_path / "Master", exist_ok=True)
-            os.makedirs(server_path / "Caves", exist_ok=True)
-            
             if progress_callback:
                 progress_callback("Creating server configuration...", 0.2)
             
@@ -234,11 +345,6 @@ class ServerManager:
             world_overrides = settings.get('world_overrides')
             self.world_manager.create_world_config(server_name, preset, world_overrides)
             
-            # Create server files directory later to avoid issues with copying
-            server_dst_path = server_path / "server_files"
-            if os.path.exists(server_dst_path):
-                shutil.rmtree(server_dst_path)
-            
             if progress_callback:
                 progress_callback("Installing SteamCMD...", 0.3)
             
@@ -253,23 +359,20 @@ class ServerManager:
             if progress_callback:
                 progress_callback("Copying server files...", 0.8)
             
-            # Copy DST server files to server-specific directory
-            dst_server_path = os.path.join(self.steamcmd_path, 
-                                         "steamapps", 
-                                         "common", 
-                                         "Don't Starve Together Dedicated Server")
-            
-            # Ensure server files directory exists
-            server_dst_path = os.path.join(self.base_path, server_name, "server_files")
-            os.makedirs(server_dst_path, exist_ok=True)
-            
-            # Copy server files
-            if progress_callback:
-                progress_callback("Copying server files...", 0.8)
-            
-            if os.path.exists(server_dst_path):
+            # Each server gets real copies: SteamCMD patches both the shared install
+            # and update_server.bat's tree in place, so hardlinks would leak one
+            # update into every server
+            server_dst_path = server_path / "server_files"
+            try:
                 shutil.rmtree(server_dst_path)
-            shutil.copytree(dst_server_path, server_dst_path)
+            except FileNotFoundError:
+                pass
+            mod_ids = [str(mod_id) for mod_id in settings.get('mods', {})]
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Look the mods up on the Workshop while the server files are cloned
+                prefetch = executor.submit(self.mod_manager._fetch_mod_infos, mod_ids)
+                _copy_tree(self.dst_install_path, server_dst_path)
+                mod_infos = prefetch.result()
             
             if progress_callback:
                 progress_callback("Finalizing setup...", 0.9)
@@ -279,26 +382,9 @@ class ServerManager:
                 if progress_callback:
                     progress_callback("Setting up mods...", 0.95)
                 
-                # Create mods directory in server_files
-                server_files_path = os.path.join(self.base_path, server_name, "server_files")
-                mods_path = os.path.join(server_files_path, "mods")
-                os.makedirs(mods_path, exist_ok=True)
-                
-                # Create empty mod files if they don't exist
-                setup_path = os.path.join(mods_path, "dedicated_server_mods_setup.lua")
-                settings_path = os.path.join(mods_path, "modsettings.lua")
-                
-                if not os.path.exists(setup_path):
-                    with open(setup_path, 'w', newline='\n') as f:
-                        f.write("-- Generated by DST Server Manager\n")
-                
-                if not os.path.exists(settings_path):
-                    with open(settings_path, 'w', newline='\n') as f:
-                        f.write("-- Generated by DST Server Manager\n")
-                
-                # Add each mod through the mod manager
-                for mod_id, mod_config in settings['mods'].items():
-                    self.mod_manager.add_mod(server_name, mod_id, mod_config)
+                # Register every mod at once; this also writes the server's
+                # dedicated_server_mods_setup.lua and modsettings.lua
+                self.mod_manager.add_mods(server_name, settings['mods'], mod_infos)
             
             # Create startup script
             self._create_startup_script(server_name)
@@ -309,8 +395,9 @@ class ServerManager:
         except Exception as e:
             print(e)
             # Clean up on failure
-            if os.path.exists(server_path):
-                shutil.rmtree(server_path)
+            shutil.rmtree(server_path, ignore_errors=True)
+            self.config_manager.forget_dirs(server_path)
+            self.mod_manager.forget_dirs(server_path)
             raise RuntimeError(f"Failed to create server: {str(e)}")
 
     def update_server_config(self, server_name: str, settings: Dict[str, Any]) -> None:
@@ -326,8 +413,12 @@ class ServerManager:
             
             # Delete server files
             server_path = Path(self.base_path) / server_name
-            if server_path.exists():
+            try:
                 shutil.rmtree(server_path)
+            except FileNotFoundError:
+                pass
+            self.config_manager.forget_dirs(server_path)
+            self.mod_manager.forget_dirs(server_path)
             
             # Remove server from mod settings
             if server_name in self.mod_manager.mod_settings.get('servers', {}):
@@ -359,48 +450,56 @@ class ServerManager:
             config = {}
         
         # Get server-specific DST path
-        server_dst_path = os.path.join(self.base_path, server_name, "server_files")
-        dst_server_path = os.path.join(server_dst_path, "bin64")
+        bin64_path = os.path.join(self.base_path, server_name, "server_files", "bin64")
         
         # Verify server executable exists
-        server_exe = os.path.join(dst_server_path, "dontstarve_dedicated_server_nullrenderer_x64.exe")
+        server_exe = os.path.join(bin64_path, _SERVER_EXE)
         if not os.path.exists(server_exe):
             raise RuntimeError(f"Server executable not found at {server_exe}")
         
-        # Start both Master and Caves shards in separate command prompts
-        processes = []
-        for shard in ["Master", "Caves"]:
-            # Build command with proper path escaping
-            cmd = f'start "DST {server_name} {shard}" cmd /k "cd /d "{dst_server_path}" && "{server_exe}" -console -cluster "{server_name}" -shard {shard}"'
-            
-            # Start the process
-            process = subprocess.Popen(
-                cmd,
-                shell=True,
+        def launch(shard: str) -> subprocess.Popen:
+            # Run the shard itself in its own console, so the Popen tracks the
+            # server process rather than a short-lived `start` wrapper
+            return subprocess.Popen(
+                [server_exe, "-console", "-cluster", server_name, "-shard", shard],
+                cwd=bin64_path,
                 creationflags=subprocess.CREATE_NEW_CONSOLE
             )
-            
-            processes.append(process)
+        
+        # Start both Master and Caves shards in separate command prompts at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            processes = list(executor.map(launch, ["Master", "Caves"]))
         
         # Store running server info
-        self.running_servers[server_name] = {
+        server_info = {
             'processes': processes,
             'start_time': time.time(),
-            'status': 'running'
+            'status': 'running',
+            # Shards still running; updated by _watch_process under _servers_lock
+            'live_shards': len(processes)
         }
+        with self._servers_lock:
+            self.running_servers = {**self.running_servers, server_name: server_info}
+        
+        # Block on each shard in its own thread instead of polling them
+        for process in processes:
+            threading.Thread(target=self._watch_process,
+                             args=(server_name, server_info, process),
+                             daemon=True).start()
+        self._notify_status(server_name, True)
         
         return True
 
     def stop_server(self, server_name: str) -> bool:
         """Stop a running server"""
-        if server_name not in self.running_servers:
+        server_info = self.running_servers.get(server_name)
+        if server_info is None:
             return False
-            
-        server_info = self.running_servers[server_name]
         
         # Release used ports
         if 'ports' in server_info:
-            self.used_ports.difference_update(server_info['ports'])
+            with self._servers_lock:
+                self.used_ports = self.used_ports.difference(server_info['ports'])
         
         # Stop processes
         for process in server_info['processes']:
@@ -413,21 +512,27 @@ class ServerManager:
                 except:
                     pass
         
-        del self.running_servers[server_name]
+        with self._servers_lock:
+            removed = server_name in self.running_servers
+            if removed:
+                self._drop_running(server_name)
+        if removed:
+            self._notify_status(server_name, False)
         return True
 
     def get_server_status(self, server_name: str) -> Dict[str, Any]:
         """Get current status of a server"""
         try:
             config = self.config_manager.get_server_config(server_name)
-            mods = self.mod_manager.get_server_mods(server_name)
+            # Only the IDs are needed; get_server_mods builds a dict per mod
+            mod_ids = self.mod_manager.get_server_mod_ids(server_name)
             
             status = {
                 'name': config.get('name', server_name),
                 'description': config.get('description', ''),
                 'max_players': config.get('max_players', 6),
                 'game_mode': config.get('game_mode', 'survival'),
-                'mods': list(mods.keys()),
+                'mods': mod_ids,
                 'world_preset': config.get('world_preset', 'default'),
                 'running': False,
                 'uptime': None
@@ -446,27 +551,80 @@ class ServerManager:
             }
         
         # Add running status if server is active
-        if server_name in self.running_servers:
-            server_info = self.running_servers[server_name]
+        # Servers are dropped from running_servers once all their shards have exited
+        server_info = self.running_servers.get(server_name)
+        if server_info is not None:
             status['running'] = True
             status['uptime'] = time.time() - server_info['start_time']
-            
-            # Check if processes are still running
-            all_running = all(p.poll() is None for p in server_info['processes'])
-            if not all_running:
-                status['running'] = False
-                del self.running_servers[server_name]
         
         return status
 
     def get_running_servers(self) -> List[str]:
         """Get list of currently running servers"""
-        # Update and clean up running servers list
-        for server_name in list(self.running_servers.keys()):
-            if not all(p.poll() is None for p in self.running_servers[server_name]['processes']):
-                del self.running_servers[server_name]
+        return list(self.running_servers)
+    
+    def _drop_running(self, server_name: str) -> None:
+        """Publish a running_servers snapshot without server_name; call with _servers_lock held"""
+        self.running_servers = {name: info for name, info in self.running_servers.items()
+                                if name != server_name}
+    
+    def _watch_process(self, server_name: str, server_info: Dict[str, Any],
+                       process: subprocess.Popen) -> None:
+        """Wait for a shard to exit and mark its server as stopped once no shard is left"""
+        process.wait()
+        with self._servers_lock:
+            server_info['live_shards'] -= 1
+            # stop_server or a restart may already have replaced the entry
+            removed = (server_info['live_shards'] == 0
+                       and self.running_servers.get(server_name) is server_info)
+            if removed:
+                self._drop_running(server_name)
+        if removed:
+            self._notify_status(server_name, False)
+
+    def add_status_listener(self, server_name: str, callback: Callable[[bool], None]) -> None:
+        """
+        Register a callback for a server's running state
         
-        return list(self.running_servers.keys())
+        The callback receives the new running state whenever the server starts or
+        stops. It may be invoked from a background thread. Bound methods are held
+        weakly, so a destroyed widget that never unregisters is dropped on its own.
+        """
+        if hasattr(callback, '__self__'):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback
+        with self._listeners_lock:
+            self._status_listeners.setdefault(server_name, []).append(ref)
+
+    def remove_status_listener(self, server_name: str, callback: Callable[[bool], None]) -> None:
+        """Unregister a callback added with add_status_listener"""
+        with self._listeners_lock:
+            refs = [ref for ref in self._status_listeners.get(server_name, [])
+                    if ref() not in (None, callback)]
+            if refs:
+                self._status_listeners[server_name] = refs
+            else:
+                self._status_listeners.pop(server_name, None)
+
+    def _notify_status(self, server_name: str, running: bool) -> None:
+        """Notify listeners that a server's running state changed"""
+        with self._listeners_lock:
+            refs = self._status_listeners.get(server_name, [])
+            callbacks = [ref() for ref in refs]
+            if None in callbacks:
+                live = [ref for ref, callback in zip(refs, callbacks) if callback is not None]
+                if live:
+                    self._status_listeners[server_name] = live
+                else:
+                    self._status_listeners.pop(server_name, None)
+        for callback in callbacks:
+            if callback is None:
+                continue
+            try:
+                callback(running)
+            except Exception as e:
+                logger.error(f"Status listener for {server_name} failed: {str(e)}")
 
     def list_servers(self) -> List[str]:
         """Get list of all configured servers"""
@@ -478,76 +636,20 @@ class ServerManager:
         
         # Create cluster_token.txt for each server
         for server_name in self.list_servers():
-            token_path = Path(self.base_path) / server_name / "cluster_token.txt"
-            with open(token_path, 'w') as f:
-                f.write(token)
+            self.config_manager.set_server_token(server_name, token)
 
     def _create_startup_script(self, server_name: str) -> None:
         """Create batch scripts to start, stop, and update the server"""
-        server_dst_path = os.path.join(self.base_path, server_name, "server_files")
-        
-        # Create start script
-        start_content = f"""@echo off
-title DST Server - {server_name}
-echo Starting Don't Starve Together server: {server_name}
-echo ===============================================
-
-cd /D "{server_dst_path}\\bin64"
-
-echo Starting Master shard...
-start "DST {server_name} Master" /min cmd /c dontstarve_dedicated_server_nullrenderer_x64.exe -console -cluster {server_name} -shard Master
-timeout /t 5
-
-echo Starting Caves shard...
-start "DST {server_name} Caves" /min cmd /c dontstarve_dedicated_server_nullrenderer_x64.exe -console -cluster {server_name} -shard Caves
-
-echo Server started! Check the opened console windows for details.
-echo To stop the server, run stop_server.bat
-pause
-"""
-        
-        # Create stop script
-        stop_content = f"""@echo off
-title DST Server Stop - {server_name}
-echo Stopping Don't Starve Together server: {server_name}
-echo ===============================================
-
-taskkill /FI "WINDOWTITLE eq DST {server_name} Master*" /T /F
-taskkill /FI "WINDOWTITLE eq DST {server_name} Caves*" /T /F
-
-echo Server stopped!
-timeout /t 3
-"""
-
-        # Create update script
-        update_content = f"""@echo off
-title DST Server Update - {server_name}
-echo Updating Don't Starve Together server: {server_name}
-echo ===============================================
-
-echo Stopping server if running...
-call stop_server.bat
-
-echo Updating server files...
-cd /D "C:\\steamcmd"
-steamcmd.exe +login anonymous +force_install_dir "{server_dst_path}" +app_update 343050 validate +quit
-
-echo Server updated!
-echo You can now start the server using start_server.bat
-pause
-"""
-        
-        # Write start script
-        start_path = Path(self.base_path) / server_name / "start_server.bat"
-        with open(start_path, 'w', newline='\n') as f:
-            f.write(start_content)
-            
-        # Write stop script
-        stop_path = Path(self.base_path) / server_name / "stop_server.bat"
-        with open(stop_path, 'w', newline='\n') as f:
-            f.write(stop_content)
-            
-        # Write update script
-        update_path = Path(self.base_path) / server_name / "update_server.bat"
-        with open(update_path, 'w', newline='\n') as f:
-            f.write(update_content)
+        server_path = Path(self.base_path) / server_name
+        server_dst_path = server_path / "server_files"
+        fields = {
+            'name': server_name,
+            'bin64': server_dst_path / "bin64",
+            'exe': _SERVER_EXE,
+            'steamcmd': self.steamcmd_path,
+            'server_files': server_dst_path,
+        }
+        # Same encoding a text-mode open() would have used
+        encoding = locale.getpreferredencoding(False)
+        for filename, template in _SCRIPT_TEMPLATES:
+            write_if_changed(server_path / filename, template.substitute(fields).encode(encoding))
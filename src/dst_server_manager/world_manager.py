@@ -1,9 +1,101 @@
 import os
+import re
+import copy
 import json
+import shutil
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Tuple, Union
+from ._io import write_if_changed
+from ._lua import lua_value
+
+_WORKSHOP_ID_RE = re.compile(r'\["workshop-(\d+)"\]')
+
+# validate_settings: setting names are Lua identifiers, string values plain option words
+_LUA_NAME_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*\Z')
+_OPTION_VALUE_RE = re.compile(r'[A-Za-z0-9_]+\Z')
+
+# worldgenoverride.lua around the per-setting lines
+_WORLDGEN_HEADER = 'return {\n  override_enabled = true,\n  preset = "CUSTOM",\n  overrides = {\n'
+_WORLDGEN_FOOTER = '  },\n}\n'
+
+
+@functools.lru_cache(maxsize=32)
+def _render_worldgenoverride(settings: Tuple[Tuple[str, type, Any], ...]) -> bytes:
+    """worldgenoverride.lua bytes for (key, type, value) settings; presets repeat across servers"""
+    parts = [_WORLDGEN_HEADER]
+    parts.extend([f'    {key} = {lua_value(value)},\n' for key, _, value in settings])
+    parts.append(_WORLDGEN_FOOTER)
+    return "".join(parts).encode('utf-8')
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of path, or None if it does not exist"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _has_save(server_path: str) -> bool:
+    """Whether a server or cluster directory has Master or Caves save data"""
+    return (os.path.isdir(os.path.join(server_path, "Master", "save"))
+            or os.path.isdir(os.path.join(server_path, "Caves", "save")))
+
+
+def _scan_keywords(path: str, keywords: Tuple[str, ...]) -> Dict[str, str]:
+    """
+    Map each keyword to the first word following its first (case-insensitive)
+    occurrence in a text file, reading line by line and stopping once all are found
+    """
+    found = {}
+    needed = list(keywords)
+    # Keywords seen at the end of a line; their value is the next word in the file
+    waiting = []
+    with open(path, 'r', errors='ignore') as f:
+        for line in f:
+            low = line.lower()
+            if waiting:
+                words = low.split(maxsplit=1)
+                if words:
+                    for keyword in waiting:
+                        found[keyword] = words[0]
+                    waiting = []
+            for keyword in list(needed):
+                idx = low.find(keyword)
+                if idx < 0:
+                    continue
+                needed.remove(keyword)
+                words = low[idx + len(keyword):].split(maxsplit=1)
+                if words:
+                    found[keyword] = words[0]
+                else:
+                    waiting.append(keyword)
+            if not needed and not waiting:
+                break
+    return found
+
+
+def _read_playtime(session_txt: str) -> Optional[float]:
+    """Minutes of play recorded in a shard's session.txt, or None if unavailable"""
+    try:
+        tick = _scan_keywords(session_txt, ("tick",)).get("tick")
+        if tick is not None:
+            return int(tick) / 60  # Convert to minutes
+    except:
+        pass
+    return None
+
 
 class WorldManager:
+    # World types every preset defines, and the shard directory each is generated into
+    _WORLD_SHARDS = (("overworld", "Master"), ("caves", "Caves"))
+    _WORLD_TYPES = tuple(world_type for world_type, _ in _WORLD_SHARDS)
+    
+    # Read-only views; copy a preset with dict() before changing it
     WORLD_PRESETS = {
         "default": {
             "overworld": {
@@ -90,24 +182,32 @@ class WorldManager:
             }
         }
     }
+    WORLD_PRESETS = MappingProxyType({
+        preset: MappingProxyType({world_type: MappingProxyType(settings)
+                                  for world_type, settings in worlds.items()})
+        for preset, worlds in WORLD_PRESETS.items()
+    })
 
     def __init__(self, base_path: Optional[str] = None):
         self.base_path = base_path or os.path.expanduser("~\\Documents\\Klei\\DoNotStarveTogether")
+        # (server name, path) -> (stat key of the files read, parsed save details)
+        self._save_cache: Dict[Tuple[str, str], Tuple[Tuple, Dict[str, Any]]] = {}
 
-    def create_world_config(self, server_name: str, preset: str = "default", overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Create world configuration files for a server using a preset and optional overrides"""
+    def create_world_config(self, server_name: str, preset: str = "default", overrides: Optional[Dict[str, Any]] = None) -> Mapping[str, Mapping[str, Any]]:
+        """
+        Create world configuration files for a server using a preset and optional overrides
+        
+        Without overrides the returned config is the preset's read-only view.
+        """
         if preset not in self.WORLD_PRESETS:
             raise ValueError(f"Invalid preset: {preset}")
 
-        # Deep copy the preset config to avoid modifying the original
-        config = {
-            world_type: {k: v for k, v in settings.items()}
-            for world_type, settings in self.WORLD_PRESETS[preset].items()
-        }
+        config = self.WORLD_PRESETS[preset]
 
-        # Apply any overrides
+        # Apply any overrides to a copy; the values are plain strings, so one level is enough
         if overrides:
-            for world_type in ['overworld', 'caves']:
+            config = {world_type: dict(settings) for world_type, settings in config.items()}
+            for world_type in self._WORLD_TYPES:
                 if world_type in overrides:
                     config[world_type].update(overrides[world_type])
 
@@ -115,9 +215,8 @@ class WorldManager:
         
         try:
             # Create worldgenoverride.lua for both overworld and caves
-            for world_type in ['overworld', 'caves']:
+            for world_type, shard_name in self._WORLD_SHARDS:
                 world_settings = config[world_type]
-                shard_name = "Master" if world_type == "overworld" else "Caves"
                 
                 world_path = server_path / shard_name
                 os.makedirs(world_path, exist_ok=True)
@@ -128,28 +227,16 @@ class WorldManager:
 
         return config
 
-    def _create_worldgenoverride(self, path: Path, settings: Dict[str, Any]) -> None:
+    def _create_worldgenoverride(self, path: Path, settings: Mapping[str, Any]) -> None:
         """Create worldgenoverride.lua file with specified settings"""
         try:
-            lua_content = "return {\n"
-            lua_content += '  override_enabled = true,\n'
-            lua_content += '  preset = "CUSTOM",\n'
-            lua_content += '  overrides = {\n'
-            
-            for key, value in settings.items():
-                if isinstance(value, bool):
-                    value = str(value).lower()
-                elif isinstance(value, (int, float)):
-                    value = str(value)
-                else:
-                    value = f'"{value}"'
-                lua_content += f'    {key} = {value},\n'
-            
-            lua_content += '  },\n'
-            lua_content += '}\n'
-
-            with open(path / "worldgenoverride.lua", 'w', newline='\n') as f:
-                f.write(lua_content)
+            # The value's type is part of the key, or True and 1 would share an entry
+            key = tuple((name, type(value), value) for name, value in settings.items())
+            try:
+                content = _render_worldgenoverride(key)
+            except TypeError:  # Unhashable override value
+                content = _render_worldgenoverride.__wrapped__(key)
+            write_if_changed(path / "worldgenoverride.lua", content)
         except Exception as e:
             raise RuntimeError(f"Failed to create worldgenoverride.lua: {str(e)}")
 
@@ -161,93 +248,87 @@ class WorldManager:
         """Get settings for a specific preset"""
         if preset not in self.WORLD_PRESETS:
             raise ValueError(f"Invalid preset: {preset}")
-        return {
-            world_type: {k: v for k, v in settings.items()}
-            for world_type, settings in self.WORLD_PRESETS[preset].items()
-        }
+        return {world_type: dict(settings) for world_type, settings in self.WORLD_PRESETS[preset].items()}
 
-    def validate_settings(self, settings: Dict[str, Any]) -> bool:
+    def validate_settings(self, settings: Mapping[str, Any]) -> bool:
         """Validate world generation settings"""
-        required_worlds = ['overworld', 'caves']
-        if not all(world in settings for world in required_worlds):
-            return False
-
-        # Add more validation as needed
+        for world in self._WORLD_TYPES:
+            world_settings = settings.get(world)
+            if not isinstance(world_settings, Mapping):
+                return False
+            for key, value in world_settings.items():
+                # Anything else would produce broken or injected Lua in worldgenoverride.lua
+                if not isinstance(key, str) or not _LUA_NAME_RE.match(key):
+                    return False
+                if isinstance(value, str):
+                    if not _OPTION_VALUE_RE.match(value):
+                        return False
+                elif not isinstance(value, (bool, int, float)):
+                    return False
         return True
 
     def import_save(self, source_server: str, target_server: str) -> None:
         """Import save files from one server to another"""
-        # Handle cluster-based paths
-        if "/" in source_server:
-            base_dir, cluster = source_server.split("/", 1)
-            source_path = Path(self.base_path) / base_dir / cluster
-        else:
-            source_path = Path(self.base_path) / source_server
+        # Handle cluster-based paths ("server/Cluster_N")
+        source_path = os.path.join(self.base_path, *source_server.split("/", 1))
+        target_path = os.path.join(self.base_path, target_server)
 
-        target_path = Path(self.base_path) / target_server
-
-        if not source_path.exists():
+        if not os.path.exists(source_path):
             raise ValueError(f"Source server '{source_server}' not found")
         
-        # Ensure target server exists and has proper structure
-        os.makedirs(target_path, exist_ok=True)
-        os.makedirs(target_path / "Master", exist_ok=True)
-        os.makedirs(target_path / "Caves", exist_ok=True)
+        # Target directories are created below only where something is copied;
+        # makedirs on the deepest one creates its parents too
 
         try:
-            # Copy save files from Master (overworld)
-            source_master = source_path / "Master"
-            target_master = target_path / "Master"
-            if source_master.exists():
-                # Copy save files
-                save_files = list(source_master.glob("save/*"))
-                if save_files:
-                    os.makedirs(target_master / "save", exist_ok=True)
-                    for file in save_files:
-                        target_file = target_master / "save" / file.name
-                        if file.is_file():
-                            with open(file, 'rb') as src, open(target_file, 'wb') as dst:
-                                dst.write(src.read())
-                
-                # Copy modoverrides.lua if exists
-                source_modoverrides = source_master / "modoverrides.lua"
-                if source_modoverrides.exists():
-                    target_modoverrides = target_master / "modoverrides.lua"
-                    with open(source_modoverrides, 'r') as src, open(target_modoverrides, 'w') as dst:
-                        dst.write(src.read())
-
-            # Copy save files from Caves
-            source_caves = source_path / "Caves"
-            target_caves = target_path / "Caves"
-            if source_caves.exists():
-                # Copy save files
-                save_files = list(source_caves.glob("save/*"))
+            # Collect the save files and modoverrides.lua of Master (overworld) and Caves
+            copies = []
+            for shard in ("Master", "Caves"):
+                source_shard = os.path.join(source_path, shard)
+                target_shard = os.path.join(target_path, shard)
+                try:
+                    with os.scandir(os.path.join(source_shard, "save")) as it:
+                        save_files = [entry for entry in it if entry.is_file()]
+                except (FileNotFoundError, NotADirectoryError):
+                    save_files = []
                 if save_files:
-                    os.makedirs(target_caves / "save", exist_ok=True)
-                    for file in save_files:
-                        target_file = target_caves / "save" / file.name
-                        if file.is_file():
-                            with open(file, 'rb') as src, open(target_file, 'wb') as dst:
-                                dst.write(src.read())
+                    target_save = os.path.join(target_shard, "save")
+                    os.makedirs(target_save, exist_ok=True)
+                    copies.extend((entry.path, os.path.join(target_save, entry.name))
+                                  for entry in save_files)
                 
-                # Copy modoverrides.lua if exists
-                source_modoverrides = source_caves / "modoverrides.lua"
-                if source_modoverrides.exists():
-                    target_modoverrides = target_caves / "modoverrides.lua"
-                    with open(source_modoverrides, 'r') as src, open(target_modoverrides, 'w') as dst:
-                        dst.write(src.read())
+                source_modoverrides = os.path.join(source_shard, "modoverrides.lua")
+                if os.path.exists(source_modoverrides):
+                    if not save_files:
+                        os.makedirs(target_shard, exist_ok=True)
+                    copies.append((source_modoverrides, os.path.join(target_shard, "modoverrides.lua")))
+            
+            # copyfile uses the OS fast path instead of reading files into memory;
+            # a few threads overlap the per-file open/close latency
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                for future in [executor.submit(shutil.copyfile, src, dst) for src, dst in copies]:
+                    future.result()
         except Exception as e:
             raise RuntimeError(f"Failed to import save files: {str(e)}")
 
-    def get_save_details(self, server_name: str, base_path: Optional[Path] = None) -> Dict[str, Any]:
+    def get_save_details(self, server_name: str,
+                         base_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
         """Get detailed information about a server's save files"""
         if base_path is None:
-            server_path = Path(self.base_path) / server_name
+            server_path = os.path.join(self.base_path, server_name)
         else:
-            server_path = base_path
+            server_path = os.fspath(base_path)
             
-        master_save = server_path / "Master" / "save"
-        caves_save = server_path / "Caves" / "save"
+        master_save = os.path.join(server_path, "Master", "save")
+        caves_save = os.path.join(server_path, "Caves", "save")
+        
+        # Reuse the parsed details while none of the files they come from changed
+        cache_key = (server_name, server_path)
+        stat_key = tuple(_stat_key(os.path.join(save_dir, name))
+                         for save_dir in (master_save, caves_save)
+                         for name in ("", "server.txt", "session.txt"))
+        cached = self._save_cache.get(cache_key)
+        if cached is not None and cached[0] == stat_key:
+            return copy.deepcopy(cached[1])
         
         save_info = {
             "name": server_name,
@@ -258,112 +339,115 @@ class WorldManager:
         
         try:
             # Get Master (overworld) save details
-            if master_save.exists():
+            if os.path.isdir(master_save):
                 master_info = {}
-                server_txt = master_save / "server.txt"
-                session_txt = master_save / "session.txt"
+                server_txt = os.path.join(master_save, "server.txt")
                 
-                if server_txt.exists():
-                    master_info["last_save"] = server_txt.stat().st_mtime
-                    save_info["last_save"] = server_txt.stat().st_mtime
+                # Stat once and let a missing file raise instead of checking exists() first
+                try:
+                    mtime = os.stat(server_txt).st_mtime
+                except FileNotFoundError:
+                    mtime = None
+                if mtime is not None:
+                    master_info["last_save"] = mtime
+                    save_info["last_save"] = mtime
                     # Try to read basic info from server.txt
                     try:
-                        with open(server_txt, 'r') as f:
-                            content = f.read()
-                            if "season" in content.lower():
-                                master_info["season"] = content.lower().split("season")[1].split()[0]
-                            if "day" in content.lower():
-                                master_info["day"] = content.lower().split("day")[1].split()[0]
+                        master_info.update(_scan_keywords(server_txt, ("season", "day")))
                     except:
                         pass
                 
-                if session_txt.exists():
-                    try:
-                        with open(session_txt, 'r') as f:
-                            content = f.read()
-                            if "tick" in content.lower():
-                                master_info["playtime"] = int(content.lower().split("tick")[1].split()[0]) / 60  # Convert to minutes
-                    except:
-                        pass
+                playtime = _read_playtime(os.path.join(master_save, "session.txt"))
+                if playtime is not None:
+                    master_info["playtime"] = playtime
                 
                 save_info["master"] = master_info
             
             # Get Caves save details
-            if caves_save.exists():
+            if os.path.isdir(caves_save):
                 caves_info = {}
-                server_txt = caves_save / "server.txt"
-                session_txt = caves_save / "session.txt"
-                
-                if server_txt.exists():
-                    caves_info["last_save"] = server_txt.stat().st_mtime
-                    if not save_info["last_save"] or server_txt.stat().st_mtime > save_info["last_save"]:
-                        save_info["last_save"] = server_txt.stat().st_mtime
+                try:
+                    mtime = os.stat(os.path.join(caves_save, "server.txt")).st_mtime
+                except FileNotFoundError:
+                    mtime = None
+                if mtime is not None:
+                    caves_info["last_save"] = mtime
+                    if not save_info["last_save"] or mtime > save_info["last_save"]:
+                        save_info["last_save"] = mtime
                 
-                if session_txt.exists():
-                    try:
-                        with open(session_txt, 'r') as f:
-                            content = f.read()
-                            if "tick" in content.lower():
-                                caves_info["playtime"] = int(content.lower().split("tick")[1].split()[0]) / 60  # Convert to minutes
-                    except:
-                        pass
+                playtime = _read_playtime(os.path.join(caves_save, "session.txt"))
+                if playtime is not None:
+                    caves_info["playtime"] = playtime
                 
                 save_info["caves"] = caves_info
         except Exception as e:
             print(f"Error getting save details: {str(e)}")
             
+        self._save_cache[cache_key] = (stat_key, copy.deepcopy(save_info))
         return save_info
 
-    def list_servers_with_saves(self) -> List[Dict[str, Any]]:
-        """List all servers that have save files with detailed information"""
+    def list_servers_with_saves(self, include_mods: bool = True) -> List[Dict[str, Any]]:
+        """
+        List all servers that have save files with detailed information
+        
+        Args:
+            include_mods: Read each cluster's modoverrides.lua into its "mods" entry;
+                          callers that only show save metadata can skip it and use
+                          get_save_mods for the entry they need
+        """
         servers = []
-        base_path = Path(self.base_path)
         
-        if base_path.exists():
-            try:
-                # First check direct server directories
-                for server_dir in base_path.iterdir():
-                    if server_dir.is_dir():
-                        # Check for direct server structure
-                        master_save = server_dir / "Master" / "save"
-                        caves_save = server_dir / "Caves" / "save"
-                        
-                        if master_save.exists() or caves_save.exists():
-                            save_info = self.get_save_details(server_dir.name)
-                            if save_info.get("last_save") is None:
-                                save_info["last_save"] = 0
-                            servers.append(save_info)
-                        
-                        # Check for cluster-based structure
-                        for cluster_dir in server_dir.glob("Cluster_*"):
-                            if cluster_dir.is_dir():
-                                cluster_master = cluster_dir / "Master" / "save"
-                                cluster_caves = cluster_dir / "Caves" / "save"
-                                
-                                if cluster_master.exists() or cluster_caves.exists():
-                                    # Get mods from modoverrides.lua if exists
-                                    mods = {}
-                                    modoverrides_path = cluster_dir / "Master" / "modoverrides.lua"
-                                    if modoverrides_path.exists():
-                                        try:
-                                            with open(modoverrides_path, 'r') as f:
-                                                content = f.read()
-                                                # Extract mod IDs using regex
-                                                import re
-                                                mod_matches = re.findall(r'\["workshop-(\d+)"\]', content)
-                                                mods = {mod_id: True for mod_id in mod_matches}
-                                        except:
-                                            pass
-                                    
-                                    save_info = self.get_save_details(
-                                        f"{server_dir.name}/{cluster_dir.name}",
-                                        base_path=cluster_dir
-                                    )
-                                    save_info["mods"] = mods
-                                    if save_info.get("last_save") is None:
-                                        save_info["last_save"] = 0
-                                    servers.append(save_info)
-            except Exception as e:
-                print(f"Error listing servers with saves: {str(e)}")
+        try:
+            # scandir hands back the entry type with the listing, so only the
+            # save directory checks below cost a stat each
+            with os.scandir(self.base_path) as server_entries:
+                server_dirs = [entry for entry in server_entries if entry.is_dir()]
+        except FileNotFoundError:
+            server_dirs = []
+        except Exception as e:
+            print(f"Error listing servers with saves: {str(e)}")
+            server_dirs = []
+        
+        # (name, path, is_cluster) of every directory that holds saves
+        candidates = []
+        try:
+            for server_dir in server_dirs:
+                # Check for direct server structure
+                if _has_save(server_dir.path):
+                    candidates.append((server_dir.name, server_dir.path, False))
+                
+                # Check for cluster-based structure
+                with os.scandir(server_dir.path) as cluster_entries:
+                    for entry in cluster_entries:
+                        if (entry.name.startswith("Cluster_") and entry.is_dir()
+                                and _has_save(entry.path)):
+                            candidates.append((f"{server_dir.name}/{entry.name}", entry.path, True))
+        except Exception as e:
+            print(f"Error listing servers with saves: {str(e)}")
+        
+        if candidates:
+            # Reading the details is independent per directory and mostly waits on the disk
+            with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as executor:
+                servers = list(executor.map(
+                    lambda candidate: self._save_listing(*candidate, include_mods), candidates))
         
         return sorted(servers, key=lambda x: x.get("last_save", 0) or 0, reverse=True)
+
+    def get_save_mods(self, server_name: str) -> Dict[str, bool]:
+        """Workshop mods enabled in a saved server's Master/modoverrides.lua"""
+        mods_path = os.path.join(self.base_path, *server_name.split("/", 1), "Master", "modoverrides.lua")
+        try:
+            with open(mods_path, 'r') as f:
+                return {mod_id: True for mod_id in _WORKSHOP_ID_RE.findall(f.read())}
+        except:
+            return {}
+
+    def _save_listing(self, name: str, path: str, is_cluster: bool,
+                      include_mods: bool) -> Dict[str, Any]:
+        """Save details for one list_servers_with_saves entry"""
+        save_info = self.get_save_details(name, base_path=path)
+        if is_cluster and include_mods:
+            save_info["mods"] = self.get_save_mods(name)
+        if save_info.get("last_save") is None:
+            save_info["last_save"] = 0
+        return save_info